@@ -14,12 +14,106 @@ Adjusted layout:
 import os
 import sys
 import traceback
-import random
+import time
+import queue
+import threading
+import types
+import collections
+import statistics
 import tkinter as tk
+import numpy as np
 from tkinter import ttk, messagebox
 
 
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional: without it the kernels below run as plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
+# Measurement noise is drawn in blocks of this size (power of two so the
+# read index wraps with a mask)
+NOISE_BUF_SIZE = 8192
+
+
+def _tcl_word(value):
+    """Quote a Python value as a single Tcl word (tuples become Tcl lists)."""
+    if isinstance(value, (tuple, list)):
+        return '{' + ' '.join(_tcl_word(v) for v in value) + '}'
+    if isinstance(value, (int, float)):
+        return str(value)
+    return '{' + str(value) + '}'
+
+
 # -------------------------- Simulation Core --------------------------
+@njit(cache=True)
+def _debounce_kernel(raw, state, timer, threshold, dt):
+    """Debounce rule on plain scalars; returns the new (state, timer)."""
+    if raw == state:
+        return state, 0.0
+    timer += dt
+    if timer >= threshold:
+        return raw, 0.0
+    return state, timer
+
+
+@njit(cache=True)
+def _step_kernel(level, high_sp, low_sp, fill_rate, drain_rate, dt, noise, coil_on,
+                 db_high_state, db_high_timer, db_high_thr,
+                 db_low_state, db_low_timer, db_low_thr,
+                 pump_mode_fill, pump_nc):
+    """
+    One simulation step on plain scalars (JIT-compiled when Numba is available).
+    Returns (level, measured, coil_on, pump_on,
+             db_high_state, db_high_timer, db_low_state, db_low_timer).
+    """
+    # Measured level with bounded noise
+    meas = min(max(level + noise, 0.0), 100.0)
+
+    # Raw switch closures based on measured level, then debounced
+    db_high_state, db_high_timer = _debounce_kernel(meas >= high_sp, db_high_state, db_high_timer, db_high_thr, dt)
+    db_low_state, db_low_timer = _debounce_kernel(meas <= low_sp, db_low_state, db_low_timer, db_low_thr, dt)
+
+    # Hysteresis: energize at High; de-energize at Low (High wins if both closed)
+    coil_on = db_high_state | (coil_on & (not db_low_state))
+
+    # Pump state via DPDT mapping (NC: runs de-energized, NO: runs energized)
+    pump_on = pump_nc ^ coil_on
+
+    # Tank dynamics with Pump effect: FILL raises the level while the pump runs,
+    # DRAIN lowers it; with the pump off the level drifts the other way.
+    sign = 1.0 - 2.0*(pump_mode_fill ^ pump_on)
+    rate = drain_rate + pump_on*(fill_rate - drain_rate)
+
+    level = min(max(level + sign*rate*dt, 0.0), 100.0)
+    return level, meas, coil_on, pump_on, db_high_state, db_high_timer, db_low_state, db_low_timer
+
+
+@njit(cache=True)
+def _step_many_kernel(out, noise, level, high_sp, low_sp, fill_rate, drain_rate, dt, coil_on,
+                      db_high_state, db_high_timer, db_high_thr,
+                      db_low_state, db_low_timer, db_low_thr,
+                      pump_mode_fill, pump_nc):
+    """
+    Run len(out) steps of _step_kernel, writing (level, measured) per step into out.
+    Returns the final (level, coil_on, db_high_state, db_high_timer, db_low_state, db_low_timer).
+    """
+    for k in range(out.shape[0]):
+        (level, meas, coil_on, pump_on,
+         db_high_state, db_high_timer, db_low_state, db_low_timer) = _step_kernel(
+            level, high_sp, low_sp, fill_rate, drain_rate, dt, noise[k], coil_on,
+            db_high_state, db_high_timer, db_high_thr,
+            db_low_state, db_low_timer, db_low_thr,
+            pump_mode_fill, pump_nc)
+        out[k, 0] = level
+        out[k, 1] = meas
+    return level, coil_on, db_high_state, db_high_timer, db_low_state, db_low_timer
+
+
 class Debouncer:
     """Simple time-based debouncer for a boolean input."""
     def __init__(self, threshold_s: float):
@@ -28,13 +122,7 @@ class Debouncer:
         self.timer = 0.0
 
     def update(self, raw: bool, dt: float):
-        if raw == self.state:
-            self.timer = 0.0
-            return self.state
-        self.timer += dt
-        if self.timer >= self.threshold:
-            self.state = raw
-            self.timer = 0.0
+        self.state, self.timer = _debounce_kernel(bool(raw), self.state, self.timer, float(self.threshold), float(dt))
         return self.state
 
 
@@ -43,15 +131,27 @@ class DPDT:
     def __init__(self, pump_contact: str = "NC"):
         self.pump_contact = pump_contact  # 'NC' or 'NO'
 
+    @property
+    def pump_contact(self) -> str:
+        return self._pump_contact
+
+    @pump_contact.setter
+    def pump_contact(self, value: str):
+        self._pump_contact = value
+        self.is_nc = (value == "NC")  # specialized once here, not compared per step
+
     def pump_on(self, coil_on: bool) -> bool:
         # NC: pump runs when coil is de-energized
         # NO: pump runs when coil is energized
-        return (not coil_on) if self.pump_contact == "NC" else coil_on
+        return self.is_nc ^ bool(coil_on)
 
 
 class TankSim:
     """Tank + relay + pump simulator."""
     def __init__(self):
+        # One PCG64 generator for the sim's lifetime; noise is drawn from it in blocks
+        self._rng = np.random.default_rng()
+
         # Process & control parameters
         self.level = 50.0          # %
         self.high_sp = 75.0        # %
@@ -72,50 +172,86 @@ class TankSim:
         # Pump effect: "FILL" or "DRAIN"
         self.pump_mode = "FILL"
 
-    def step(self, db_high_s: float, db_low_s: float):
-        """Advance the simulation one time-step and return a status dict."""
-        self.db_high.threshold = db_high_s
-        self.db_low.threshold  = db_low_s
-
-        # Measured level with bounded noise
-        meas = max(0.0, min(100.0, self.level + random.uniform(-self.noise_amp, self.noise_amp)))
+    @property
+    def pump_mode(self) -> str:
+        return self._pump_mode
 
-        # Raw switch closures based on measured level
-        raw_high = meas >= self.high_sp
-        raw_low  = meas <= self.low_sp
+    @pump_mode.setter
+    def pump_mode(self, value: str):
+        self._pump_mode = value
+        self._mode_is_fill = (value == "FILL")  # specialized once here, not compared per step
 
-        # Debounced closures
-        high_closed = self.db_high.update(raw_high, self.dt)
-        low_closed  = self.db_low.update(raw_low,  self.dt)
+    @property
+    def noise_amp(self) -> float:
+        return self._noise_amp
 
-        # Hysteresis: energize at High; de-energize at Low
-        if high_closed:
-            self.coil_on = True
-        elif low_closed:
-            self.coil_on = False
+    @noise_amp.setter
+    def noise_amp(self, value: float):
+        # Pre-drawn noise samples are consumed one per step; redraw them only
+        # when the amplitude actually changes
+        if getattr(self, '_noise_amp', None) != value:
+            self._noise_amp = value
+            self._refill_noise()
 
-        # Pump state via DPDT mapping
-        pump_on = self.dpdt.pump_on(self.coil_on)
+    def _refill_noise(self):
+        """Draw the next block of +/- noise_amp measurement noise in one vectorized call."""
+        self._noise_buf = self._rng.uniform(-self._noise_amp, self._noise_amp, size=NOISE_BUF_SIZE).astype(np.float32)
+        self._noise_idx = 0
 
-        # Tank dynamics with Pump effect
-        if self.pump_mode == "FILL":
-            # Pump ON raises level; pump OFF lets it fall
-            delta = (self.fill_rate if pump_on else -self.drain_rate) * self.dt
-        else:  # DRAIN
-            # Pump ON lowers level; pump OFF lets it rise
-            delta = (-self.fill_rate if pump_on else self.drain_rate) * self.dt
+    def step(self, db_high_s: float, db_low_s: float):
+        """
+        Advance the simulation one time-step and return a status dict.
+        Levels are raw floats; rounding for display is left to the GUI.
+        """
+        self.db_high.threshold = db_high_s
+        self.db_low.threshold  = db_low_s
 
-        self.level = max(0.0, min(100.0, self.level + delta))
+        # Next pre-drawn noise sample
+        noise = float(self._noise_buf[self._noise_idx])
+        self._noise_idx = (self._noise_idx + 1) & (NOISE_BUF_SIZE - 1)
+        if self._noise_idx == 0:
+            self._refill_noise()
+
+        hi, lo = self.db_high, self.db_low
+        (self.level, meas, self.coil_on, pump_on,
+         hi.state, hi.timer, lo.state, lo.timer) = _step_kernel(
+            float(self.level), float(self.high_sp), float(self.low_sp),
+            float(self.fill_rate), float(self.drain_rate), float(self.dt), noise, bool(self.coil_on),
+            hi.state, hi.timer, float(hi.threshold), lo.state, lo.timer, float(lo.threshold),
+            self._mode_is_fill, self.dpdt.is_nc)
+        high_closed = hi.state
+        low_closed = lo.state
 
         return {
-            "level": round(self.level, 2),
-            "measured": round(meas, 2),
+            "level": self.level,
+            "measured": meas,
             "high_closed": high_closed,
             "low_closed": low_closed,
             "coil_on": self.coil_on,
             "pump_on": pump_on,
         }
 
+    def step_many(self, n: int, db_high_s: float = None, db_low_s: float = None):
+        """
+        Fast-forward n steps in one compiled loop (for replay / parameter sweeps).
+        Returns an (n, 2) float32 array of (level, measured) per step; the sim
+        state afterwards is the same as after n calls to step().
+        """
+        if db_high_s is not None:
+            self.db_high.threshold = db_high_s
+        if db_low_s is not None:
+            self.db_low.threshold = db_low_s
+        out = np.empty((n, 2), dtype=np.float32)
+        noise = self._rng.uniform(-self._noise_amp, self._noise_amp, size=n)
+        hi, lo = self.db_high, self.db_low
+        (self.level, self.coil_on,
+         hi.state, hi.timer, lo.state, lo.timer) = _step_many_kernel(
+            out, noise, float(self.level), float(self.high_sp), float(self.low_sp),
+            float(self.fill_rate), float(self.drain_rate), float(self.dt), bool(self.coil_on),
+            hi.state, hi.timer, float(hi.threshold), lo.state, lo.timer, float(lo.threshold),
+            self._mode_is_fill, self.dpdt.is_nc)
+        return out
+
 
 # -------------------------- Tkinter GUI App --------------------------
 class App(tk.Tk):
@@ -127,8 +263,51 @@ class App(tk.Tk):
 
         self.sim = TankSim()
         self.timer = None
-        self.series = []       # time series for chart
         self.max_pts = 420     # samples kept on chart
+        # Chart time series as struct-of-arrays ring buffers (one array per field).
+        # Each is mirrored (2*max_pts, every sample written twice) so the last
+        # max_pts samples are always one contiguous slice: see _ordered().
+        self.series_level = np.zeros(2*self.max_pts, dtype=np.float32)
+        self.series_meas = np.zeros(2*self.max_pts, dtype=np.float32)
+        self.series_pump = np.zeros(2*self.max_pts, dtype=np.uint8)
+        self._head = 0         # next write slot in the ring buffers
+        self._count = 0        # valid samples in the ring buffers
+        self._total = 0        # samples pushed since the last reset (absolute index of the next one)
+        # Pump-band rects on the chart, one per contiguous pump-ON run, as
+        # [first sample, end sample (exclusive), item id] in absolute sample indices,
+        # oldest first; they are scrolled with canvas.move() and only the newest run grows
+        self._bands = collections.deque()
+        self._bands_first = 0  # absolute index of the oldest visible sample at the last sync
+        self._bands_total = 0  # self._total at the last sync
+
+        # The sim runs on a worker thread at fixed sim.dt and hands samples to the
+        # GUI through a bounded queue; the GUI drains it and repaints every
+        # _render_interval_ms, independent of the sim step rate.
+        self._render_interval_ms = 50
+        # Recent _tick wall times (s); their median is subtracted from the next
+        # after() delay so the observed tick rate converges to the target
+        self._net_delays = collections.deque(maxlen=50)
+        # Sized for ~3 s of samples at the smallest dt, so a stalled GUI (window drag,
+        # modal dialog) loses display frames rather than samples
+        self._samples = queue.Queue(maxsize=64)
+        self._sim_thread = None
+        self._sim_lock = threading.Lock()  # held by the worker per step and by GUI-side sim writes
+        self._sim_stop = threading.Event()
+        self._sim_error = None
+        self._max_substeps = 5   # max steps the worker may lag before it resyncs to wall time
+        # Plain-Python mirror of the control variables, kept current by write traces
+        # (see _bind_cfg) so the hot paths never round-trip into Tcl
+        self._cfg = types.SimpleNamespace(
+            high_sp=self.sim.high_sp, low_sp=self.sim.low_sp,
+            fill_rate=self.sim.fill_rate, drain_rate=self.sim.drain_rate,
+            dt=self.sim.dt, level0=self.sim.level, noise_amp=self.sim.noise_amp,
+            debounce_s=0.2, pump_contact=self.sim.dpdt.pump_contact, pump_mode=self.sim.pump_mode)
+        # Render gating: while the window is unmapped/obscured the tick keeps
+        # draining samples but skips the canvases until it is visible again
+        self._visible = True
+        self._dirty = False
+        self._last_sample = None
+        self._tick_watchdog_s = 1.5  # a single tick slower than this stops the sim
 
         # DPDT lever animation state (0.0 = NC side, 1.0 = NO side)
         self.dpdt_pos = 0.0
@@ -142,11 +321,30 @@ class App(tk.Tk):
         self.COLOR_TRUE = "#1e88e5"  # blue
         self.COLOR_MEAS = "#f59e0b"  # amber
         self.COLOR_PUMP = "#22c55e"  # green
+        self.COLOR_PUMP_BAND = "#d7f7e2"  # pale green, stands in for a translucent COLOR_PUMP
 
         # DPDT layout storage (coordinates relative to wiring canvas)
         self.dpdt_coords = {}
+        # Canvas ids of the animated DPDT items (created once per layout)
+        self.dpdt_items = {}
+
+        # Last value pushed to each status widget option (see _set)
+        self._last_status = {}
+        self._dropped_frames = 0  # samples drained but never rendered since Start
 
         self._build_ui()
+        for seq in ('<Map>', '<Unmap>', '<Visibility>'):
+            self.bind(seq, self._on_visibility, add='+')
+
+    def _on_visibility(self, event):
+        if event.widget is not self:
+            return  # child widgets share the toplevel's bindtag
+        if event.type == tk.EventType.Unmap:
+            self._visible = False
+        elif event.type == tk.EventType.Visibility:
+            self._visible = event.state != 'VisibilityFullyObscured'
+        else:
+            self._visible = True
 
     # -------------------- UI Construction --------------------
     def _build_ui(self):
@@ -190,6 +388,16 @@ class App(tk.Tk):
         self.var_dbms = tk.IntVar(value=200)
         self.var_pump = tk.StringVar(value=self.sim.dpdt.pump_contact)
         self.var_mode = tk.StringVar(value=self.sim.pump_mode)  # FILL or DRAIN
+        self._bind_cfg(self.var_high, 'high_sp', float)
+        self._bind_cfg(self.var_low, 'low_sp', float)
+        self._bind_cfg(self.var_fill, 'fill_rate', float)
+        self._bind_cfg(self.var_drain, 'drain_rate', float)
+        self._bind_cfg(self.var_dtms, 'dt', lambda v: float(v)/1000.0)
+        self._bind_cfg(self.var_init, 'level0', float)
+        self._bind_cfg(self.var_noise, 'noise_amp', float)
+        self._bind_cfg(self.var_dbms, 'debounce_s', lambda v: float(v)/1000.0)
+        self._bind_cfg(self.var_pump, 'pump_contact', str)
+        self._bind_cfg(self.var_mode, 'pump_mode', str)
 
         # Helper to align inputs
         def add_control(r, text, widget):
@@ -248,16 +456,17 @@ class App(tk.Tk):
         # Status box
         status = ttk.LabelFrame(controls, text='Status', style='White.TLabelframe')
         status.grid(row=13, column=0, columnspan=2, sticky='ew', padx=8, pady=8)
-        self.lbl_level = ttk.Label(status, text='Level: –', style='White.TLabel'); self.lbl_level.pack(anchor='w')
-        self.lbl_meas  = ttk.Label(status, text='Measured: –', style='White.TLabel'); self.lbl_meas.pack(anchor='w')
-        self.lbl_high  = ttk.Label(status, text='High: –', style='White.TLabel'); self.lbl_high.pack(anchor='w')
-        self.lbl_low   = ttk.Label(status, text='Low: –',  style='White.TLabel'); self.lbl_low.pack(anchor='w')
-        self.lbl_coil  = ttk.Label(status, text='Coil: –', style='White.TLabel'); self.lbl_coil.pack(anchor='w')
-        # Pump indicator row: text + LED + running tag
-        pump_row = ttk.Frame(status, style='White.TFrame'); pump_row.pack(fill='x', pady=(6,0))
-        self.lbl_pump = ttk.Label(pump_row, text='Pump: –', style='White.TLabel'); self.lbl_pump.pack(side='left')
-        self.pump_led = tk.Canvas(pump_row, width=18, height=18, bg='#ffffff', highlightthickness=0); self.pump_led.pack(side='right')
+        # One multiline label for all status lines (a single configure per tick);
+        # the pump LED sits at the right of its last line ("Pump: ...")
+        pump_row = ttk.Frame(status, style='White.TFrame'); pump_row.pack(fill='x')
+        self.lbl_status = ttk.Label(pump_row, style='White.TLabel', justify='left',
+                                    text='Level: –\nMeasured: –\nHigh: –\nLow: –\nCoil: –\nPump: –')
+        self.lbl_status.pack(side='left')
+        self.pump_led = tk.Canvas(pump_row, width=18, height=18, bg='#ffffff', highlightthickness=0); self.pump_led.pack(side='right', anchor='s')
+        # One stacked oval per LED state; a pump switch only flips their -state
         self.pump_led_id = self.pump_led.create_oval(2,2,16,16, fill='#999999', outline='#666666')
+        self._led_on = self.pump_led.create_oval(2,2,16,16, fill=self.COLOR_PUMP, outline='#1f7a1f', state='hidden')
+        self._led_off = self.pump_led.create_oval(2,2,16,16, fill='#ef4444', outline='#7f1d1d', state='hidden')
         self.lbl_running = ttk.Label(status, text='Idle', style='White.TLabel'); self.lbl_running.pack(anchor='w', pady=(6,0))
 
         # Tank panel (center)
@@ -276,6 +485,10 @@ class App(tk.Tk):
         self.chart_canvas = tk.Canvas(chart_box, width=820, height=560, bg='#ffffff',
                                       highlightthickness=1, highlightbackground='#dddddd')
         self.chart_canvas.grid(row=0, column=0, sticky='nsew', padx=8, pady=8)
+        # Cached chart size (no Tk round-trip per frame); refreshed only on <Configure>
+        self._chart_w = int(self.chart_canvas['width'])
+        self._chart_h = int(self.chart_canvas['height'])
+        self.chart_canvas.bind('<Configure>', lambda e: self._on_chart_resize(e.width, e.height))
 
         # Wiring area (below tank and chart) — spans both columns so wiring is continuous
         wiring_box = ttk.LabelFrame(self, text='Wiring / Relay', style='White.TLabelframe')
@@ -286,25 +499,44 @@ class App(tk.Tk):
         self.wiring_canvas = tk.Canvas(wiring_box, width=wiring_w, height=140, bg='#ffffff',
                                        highlightthickness=1, highlightbackground='#dddddd')
         self.wiring_canvas.grid(row=0, column=0, sticky='nsew', padx=8, pady=8)
+        # Wiring geometry depends only on the canvas size: redraw it on <Configure>, not per config
+        self._wiring_w = int(self.wiring_canvas['width'])
+        self._wiring_h = int(self.wiring_canvas['height'])
+        self.wiring_canvas.bind('<Configure>', lambda e: self._on_wiring_resize(e.width, e.height))
 
         # Initial visuals
-        self.series.clear()
-        self._draw_chart_axes()
+        self._init_chart_static()
+        self._layout_chart_axes()
         self._draw_tank_static()
         # Draw the static wiring area (pump + DPDT) and initial DPDT view
         self._draw_wiring_static()
         self._update_dpdt_view({})
 
     # -------------------- Wiring / pump image area --------------------
+    def _on_wiring_resize(self, w, h):
+        if (w, h) == (self._wiring_w, self._wiring_h):
+            return
+        self._wiring_w = w
+        self._wiring_h = h
+        self._draw_wiring_static()
+        self._update_dpdt_view({})
+
     def _draw_wiring_static(self):
-        """Draw pump at left, DPDT area at right, store coordinates in self.dpdt_coords."""
+        """
+        Draw pump at left, DPDT area at right, store coordinates in self.dpdt_coords.
+        The static items are batched into one Tcl script and evaluated in a single call.
+        """
         c = self.wiring_canvas
         c.delete('dpdt_static')
-        try:
-            w = int(c.winfo_width()) or int(c['width'])
-            h = int(c.winfo_height()) or int(c['height'])
-        except Exception:
-            w = int(c['width']); h = int(c['height'])
+        cmds = []
+
+        def create(kind, *coords, **opts):
+            opts.setdefault('tags', 'dpdt_static')
+            cmds.append(' '.join([str(c), 'create', kind] + [str(v) for v in coords] +
+                                 [f"-{k} {_tcl_word(v)}" for k, v in opts.items()]))
+
+        w = self._wiring_w
+        h = self._wiring_h
 
         margin = 12
         left_area_x = margin + 10
@@ -313,11 +545,11 @@ class App(tk.Tk):
         # Draw pump image at left area (simple vector)
         pump_x = left_area_x
         pump_y = left_area_y
-        c.create_oval(pump_x, pump_y-18, pump_x+36, pump_y+18, outline='#666666', fill='#dddddd', tags=('dpdt_static',))
-        c.create_rectangle(pump_x+36, pump_y-14, pump_x+86, pump_y+14, outline='#666666', fill='#eeeeee', tags=('dpdt_static',))
-        c.create_text(pump_x+46, pump_y+32, text='Pump', fill=self.COLOR_TEXT, tags=('dpdt_static',))
+        create('oval', pump_x, pump_y-18, pump_x+36, pump_y+18, outline='#666666', fill='#dddddd')
+        create('rectangle', pump_x+36, pump_y-14, pump_x+86, pump_y+14, outline='#666666', fill='#eeeeee')
+        create('text', pump_x+46, pump_y+32, text='Pump', fill=self.COLOR_TEXT)
         # pump terminal
-        c.create_oval(pump_x+8, pump_y-4, pump_x+12, pump_y+4, outline='#666666', fill='#ffffff', tags=('dpdt_static',))
+        create('oval', pump_x+8, pump_y-4, pump_x+12, pump_y+4, outline='#666666', fill='#ffffff')
         self.dpdt_coords['pump_term'] = (pump_x+10, pump_y)
 
         # DPDT region on the right side of wiring area
@@ -338,12 +570,12 @@ class App(tk.Tk):
         pole_y2 = pole_y1 + spacing
 
         def draw_pole(y):
-            c.create_oval(pole_x_nc-8, y-8, pole_x_nc+8, y+8, outline='#666666', fill='#ffffff', tags=('dpdt_static',))
-            c.create_oval(pole_x_com-8, y-8, pole_x_com+8, y+8, outline='#666666', fill='#ffffff', tags=('dpdt_static',))
-            c.create_oval(pole_x_no-8, y-8, pole_x_no+8, y+8, outline='#666666', fill='#ffffff', tags=('dpdt_static',))
-            c.create_text(pole_x_nc, y+18, text='NC', fill=self.COLOR_TEXT, tags=('dpdt_static',))
-            c.create_text(pole_x_com, y+18, text='COM', fill=self.COLOR_TEXT, tags=('dpdt_static',))
-            c.create_text(pole_x_no, y+18, text='NO', fill=self.COLOR_TEXT, tags=('dpdt_static',))
+            create('oval', pole_x_nc-8, y-8, pole_x_nc+8, y+8, outline='#666666', fill='#ffffff')
+            create('oval', pole_x_com-8, y-8, pole_x_com+8, y+8, outline='#666666', fill='#ffffff')
+            create('oval', pole_x_no-8, y-8, pole_x_no+8, y+8, outline='#666666', fill='#ffffff')
+            create('text', pole_x_nc, y+18, text='NC', fill=self.COLOR_TEXT)
+            create('text', pole_x_com, y+18, text='COM', fill=self.COLOR_TEXT)
+            create('text', pole_x_no, y+18, text='NO', fill=self.COLOR_TEXT)
             return {'nc': (pole_x_nc, y), 'com': (pole_x_com, y), 'no': (pole_x_no, y)}
 
         coords1 = draw_pole(pole_y1)
@@ -355,47 +587,104 @@ class App(tk.Tk):
         coil_x = (left + right) // 2
         coil_y = pole_y1 + spacing // 2
         self.dpdt_coords['coil'] = (coil_x, coil_y)
-        c.create_rectangle(coil_x-46, coil_y-18, coil_x+46, coil_y+18, outline='#666666', tags=('dpdt_static',))
-        c.create_text(coil_x, coil_y, text='COIL', fill=self.COLOR_TEXT, tags=('dpdt_static',))
+        create('rectangle', coil_x-46, coil_y-18, coil_x+46, coil_y+18, outline='#666666')
+        create('text', coil_x, coil_y, text='COIL', fill=self.COLOR_TEXT)
 
         # small static supply box connected to COM of lower pole
         com = coords2['com']
-        c.create_line(com[0], com[1], com[0]-28, com[1], fill='#666666', tags=('dpdt_static',))
-        c.create_rectangle(com[0]-36, com[1]-8, com[0]-28, com[1]+8, outline='#666666', fill='#ffffff', tags=('dpdt_static',))
-        c.create_text(com[0]-54, com[1], text='Supply', fill=self.COLOR_TEXT, tags=('dpdt_static',))
+        create('line', com[0], com[1], com[0]-28, com[1], fill='#666666')
+        create('rectangle', com[0]-36, com[1]-8, com[0]-28, com[1]+8, outline='#666666', fill='#ffffff')
+        create('text', com[0]-54, com[1], text='Supply', fill=self.COLOR_TEXT)
 
         # legend
-        c.create_text(left + box_w//2, top + box_h + 4,
-                      text='DPDT (lower pole wired to pump). Levers move to NO when coil energizes.',
-                      fill=self.COLOR_TEXT, tags=('dpdt_static',), font=('', 8))
+        create('text', left + box_w//2, top + box_h + 4,
+               text='DPDT (lower pole wired to pump). Levers move to NO when coil energizes.',
+               fill=self.COLOR_TEXT, font=('', 8))
+
+        c.tk.eval('\n'.join(cmds))
+
+        self._create_dpdt_items()
+
+    def _create_dpdt_items(self):
+        """
+        Create the animated DPDT/pump items once, on top of the static artwork.
+        _animate_dpdt only moves and recolors them, so frames create no items.
+        """
+        c = self.wiring_canvas
+        c.delete('dpdt_state')
+        tags = ('dpdt_state',)
+        items = {}
+        for pole_name in ('upper', 'lower'):
+            x_nc, y_nc = self.dpdt_coords[pole_name]['nc']
+            x_com, y_com = self.dpdt_coords[pole_name]['com']
+            x_no, y_no = self.dpdt_coords[pole_name]['no']
+            items[pole_name] = {
+                'lever': c.create_line(x_com, y_com, x_nc, y_com, fill='#7b5e57', width=3, capstyle='round', tags=tags),
+                'knob': c.create_oval(x_com-4, y_com-4, x_com+4, y_com+4, fill='#7b5e57', outline='', tags=tags),
+                'nc': c.create_oval(x_nc-6, y_nc-6, x_nc+6, y_nc+6, outline='#666666', fill='#ffffff', tags=tags),
+                'no': c.create_oval(x_no-6, y_no-6, x_no+6, y_no+6, outline='#666666', fill='#ffffff', tags=tags),
+                'com': c.create_oval(x_com-6, y_com-6, x_com+6, y_com+6, outline='#666666', fill='#ffffff', tags=tags),
+            }
+        coil_x, coil_y = self.dpdt_coords['coil']
+        items['coil'] = c.create_rectangle(coil_x-46, coil_y-16, coil_x+46, coil_y+16,
+                                           outline='#666666', fill='#ffffff', tags=tags)
+        c.create_text(coil_x, coil_y, text='COIL', fill=self.COLOR_TEXT, tags=tags)
+        pump_x, pump_y = self.dpdt_coords['pump_term']
+        items['wire'] = c.create_line(0, 0, 0, 0, fill='#999999', width=3, tags=tags, smooth=True)
+        items['com_wire'] = c.create_line(0, 0, 0, 0, fill='#bbbbbb', dash=(3,3), tags=tags)
+        items['pump_body'] = c.create_rectangle(pump_x+10, pump_y-12, pump_x+60, pump_y+12,
+                                                outline='#666666', fill='#eeeeee', tags=tags)
+        items['pump_head'] = c.create_oval(pump_x+60, pump_y-10, pump_x+80, pump_y+10,
+                                           outline='#666666', fill='#dddddd', tags=tags)
+        c.create_text(pump_x+46, pump_y+32, text='Pump', fill=self.COLOR_TEXT, tags=tags)
+        self.dpdt_items = items
+
+    def _bind_cfg(self, var, name, convert):
+        """Mirror a Tk variable into self._cfg.<name> on every write."""
+        def on_write(*_):
+            try:
+                setattr(self._cfg, name, convert(var.get()))
+            except (tk.TclError, ValueError):
+                pass  # half-typed spinbox text: keep the last valid value
+        var.trace_add('write', on_write)
 
     # -------------------- Simulation Control --------------------
     def apply_config(self):
+        cfg = self._cfg
         # Enforce Low < High
-        high = float(self.var_high.get()); low = float(self.var_low.get())
+        high = cfg.high_sp; low = cfg.low_sp
         if low >= high:
             low = high - 1.0
             self.var_low.set(low)
-        # Apply to sim
-        self.sim.high_sp = high
-        self.sim.low_sp  = low
-        self.sim.fill_rate = float(self.var_fill.get())
-        self.sim.drain_rate= float(self.var_drain.get())
-        self.sim.dt = float(self.var_dtms.get())/1000.0
-        self.sim.level = float(self.var_init.get())
-        self.sim.noise_amp = float(self.var_noise.get())
-        self.sim.dpdt.pump_contact = self.var_pump.get()
-        self.sim.pump_mode = self.var_mode.get()
+        # Apply to sim (the worker may be mid-run when Start is pressed again)
+        with self._sim_lock:
+            self.sim.high_sp = high
+            self.sim.low_sp  = low
+            self.sim.fill_rate = cfg.fill_rate
+            self.sim.drain_rate= cfg.drain_rate
+            self.sim.dt = cfg.dt
+            self.sim.level = cfg.level0
+            self.sim.noise_amp = cfg.noise_amp
+            self.sim.dpdt.pump_contact = cfg.pump_contact
+            self.sim.pump_mode = cfg.pump_mode
         # Reset chart
-        self.series.clear()
-        self._draw_chart_axes()
-        self._draw_wiring_static()
+        self._head = 0
+        self._count = 0
+        self._total = 0
+        self._clear_chart_series()
+        self._draw_thresholds()
 
     def start(self):
         self.apply_config()
         if self.timer is None:
-            self.lbl_running.configure(text='Running')
+            self._set(self.lbl_running, 'text', 'Running')
+            self._dropped_frames = 0
             self.btn_start.state(['disabled'])
+            self._samples = queue.Queue(maxsize=64)
+            self._sim_error = None
+            self._sim_stop.clear()
+            self._sim_thread = threading.Thread(target=self._sim_worker, daemon=True)
+            self._sim_thread.start()
             self._schedule_tick()
 
     def stop(self):
@@ -405,7 +694,11 @@ class App(tk.Tk):
             except Exception:
                 pass
             self.timer = None
-            self.lbl_running.configure(text='Stopped')
+            self._sim_stop.set()
+            if self._sim_thread is not None:
+                self._sim_thread.join(timeout=1.0)
+                self._sim_thread = None
+            self._set(self.lbl_running, 'text', 'Stopped')
             self.btn_start.state(['!disabled'])
 
     def reset(self):
@@ -423,136 +716,284 @@ class App(tk.Tk):
         # ensure dpdt visual reflects reset state
         self._update_dpdt_view({})
 
+    # ---- Simulation worker (no Tk calls in here) ----
+    def _sim_worker(self):
+        """Step the sim at fixed real-time pace and queue each sample for the GUI."""
+        try:
+            next_t = time.perf_counter()
+            while not self._sim_stop.is_set():
+                dbs = self._cfg.debounce_s
+                with self._sim_lock:
+                    s = self.sim.step(dbs, dbs)
+                    dt = self.sim.dt
+                try:
+                    self._samples.put_nowait(s)
+                except queue.Full:
+                    # GUI fell behind: drop the oldest sample, keep the newest
+                    try:
+                        self._samples.get_nowait()
+                    except queue.Empty:
+                        pass
+                    self._samples.put_nowait(s)
+                next_t += dt
+                delay = next_t - time.perf_counter()
+                if delay < -self._max_substeps * dt:
+                    next_t = time.perf_counter()  # too far behind to catch up: resync
+                elif delay > 0:
+                    self._sim_stop.wait(delay)
+        except Exception:
+            # reported (and the run stopped) by the next GUI tick
+            self._sim_error = traceback.format_exc()
+
     # ---- Robust tick: schedule separate from execution so exceptions don't kill GUI ----
     def _schedule_tick(self):
-        self.timer = self.after(max(1, int(self.sim.dt * 1000)), self._tick)
+        target = self._render_interval_ms
+        predicted = int(1000*statistics.median(self._net_delays)) if self._net_delays else 0
+        self.timer = self.after(max(1, target - predicted), self._tick)
 
     def _tick(self):
+        t0 = time.perf_counter()
         try:
-            dbs = float(self.var_dbms.get())/1000.0
-            s = self.sim.step(dbs, dbs)
-            self.series.append(s)
-            if len(self.series) > self.max_pts:
-                self.series.pop(0)
-            self._update_status(s)
-            self._draw_chart_series()
-            self._draw_tank_level(s['level'], self.sim.high_sp, self.sim.low_sp)
-            # Update wiring DPDT view (draw on wiring canvas)
-            self._update_dpdt_view(s)
+            if self._sim_error:
+                raise RuntimeError(f"Simulation worker failed:\n{self._sim_error}")
+            # Drain every queued sample into the series; render once with the latest
+            s = None
+            drained = 0
+            while True:
+                try:
+                    s = self._samples.get_nowait()
+                except queue.Empty:
+                    break
+                self._push_sample(s)
+                drained += 1
+            if drained > 1:
+                # Only the newest sample gets rendered; make the throttling visible
+                self._dropped_frames += drained - 1
+                self._set(self.lbl_running, 'text', f"Running (dropped {self._dropped_frames} frames)")
+            if s is not None:
+                self._last_sample = s
+                self._update_status(s)
+                self._dirty = True
+            # Skip the canvases while nobody can see them; catch up once visible
+            if self._dirty and self._visible and self.state() != 'iconic':
+                s = self._last_sample
+                self._dirty = False
+                self._draw_chart_series()
+                self._draw_tank_level(s['level'], self.sim.high_sp, self.sim.low_sp)
+                # Update wiring DPDT view (draw on wiring canvas)
+                self._update_dpdt_view(s)
         except Exception:
             # Stop timer and show the error without closing the GUI
             self.stop()
             tb = traceback.format_exc()
             messagebox.showerror("Simulation Error", f"An error occurred in the timer loop:\n\n{tb}")
             return
-        # Reschedule next tick
+        elapsed = time.perf_counter() - t0
+        if elapsed > self._tick_watchdog_s:
+            # Stop rather than keep a frozen GUI limping along
+            self.stop()
+            messagebox.showerror("Simulation Error",
+                                 f"A timer tick took {elapsed:.1f} s; the simulation was stopped.")
+            return
+        # Reschedule next tick, net of this tick's own cost
+        self._net_delays.append(elapsed)
         self._schedule_tick()
 
     # -------------------- Chart Drawing --------------------
-    def _draw_chart_axes(self):
-        c = self.chart_canvas
-        c.delete('all')
-        # Use actual widget size if available
-        try:
-            c.update_idletasks()
-            w = int(c.winfo_width()) or int(c['width'])
-            h = int(c.winfo_height()) or int(c['height'])
-        except Exception:
-            w = int(c['width']); h = int(c['height'])
+    def _on_chart_resize(self, w, h):
+        if (w, h) == (self._chart_w, self._chart_h):
+            return
         self._chart_w = w
         self._chart_h = h
+        self._layout_chart_axes()
+        self._draw_chart_series()
+
+    def _init_chart_static(self):
+        """Create every chart item once; _layout_chart_axes only moves them."""
+        c = self.chart_canvas
+        self._axis_ids = [c.create_line(0, 0, 0, 0, fill=self.COLOR_AXIS, tags='axes') for _ in range(2)]
+        self._grid_pcts = [0, 20, 40, 60, 80, 100]
+        self._grid_ids = [(c.create_line(0, 0, 0, 0, fill=self.COLOR_GRID, tags='grid'),
+                           c.create_text(24, 0, text=f"{p}%", fill=self.COLOR_TEXT, anchor='w', tags='grid'))
+                          for p in self._grid_pcts]
+        # setpoint lines (one item each, dash pattern drawn natively by Tk)
+        self.thresh_high_id = c.create_line(0, 0, 0, 0, fill=self.COLOR_MEAS, dash=(10, 6), tags='thresh')
+        self.thresh_low_id = c.create_line(0, 0, 0, 0, fill=self.COLOR_PUMP, dash=(10, 6), tags='thresh')
+        # persistent polylines; _draw_chart_series only moves their vertices
+        self.true_line_id = c.create_line(0, 0, 0, 0, fill=self.COLOR_TRUE, width=2, tags='series_line')
+        self.meas_line_id = c.create_line(0, 0, 0, 0, fill=self.COLOR_MEAS, width=1, tags='series_line')
+        # markers on the newest sample (movement is visible from sample #1)
+        self.true_head_id = c.create_oval(0, 0, 0, 0, fill=self.COLOR_TRUE, outline='', tags='series')
+        self.meas_head_id = c.create_oval(0, 0, 0, 0, fill=self.COLOR_MEAS, outline='', tags='series')
+
+    def _layout_chart_axes(self):
+        c = self.chart_canvas
+        w = self._chart_w
+        h = self._chart_h
         ml = 56; mb = 32
-        c.create_line(ml, 12, ml, h-mb, fill=self.COLOR_AXIS)
-        c.create_line(ml, h-mb, w-12, h-mb, fill=self.COLOR_AXIS)
-        for p in [0,20,40,60,80,100]:
-            y = h - mb - p*2.6
-            c.create_line(ml, y, w-12, y, fill=self.COLOR_GRID)
-            c.create_text(24, y, text=f"{p}%", fill=self.COLOR_TEXT, anchor='w')
+        # Plot geometry, computed once per layout and reused by every frame
+        self._chart_x0 = ml
+        self._chart_x1 = w - 12
+        self._chart_step_x = (w-ml-12)/self.max_pts
+        self._chart_y_scale = 2.6      # px per %
+        self._chart_y_off = h - mb     # y of 0 %
+        # x-position of every chart slot
+        self._xs = ml + np.arange(self.max_pts) * self._chart_step_x
+        c.coords(self._axis_ids[0], ml, 12, ml, h-mb)
+        c.coords(self._axis_ids[1], ml, h-mb, w-12, h-mb)
+        for p, (line_id, text_id) in zip(self._grid_pcts, self._grid_ids):
+            y = self._chart_y_off - p*self._chart_y_scale
+            c.coords(line_id, ml, y, w-12, y)
+            c.coords(text_id, 24, y)
         self._draw_thresholds()
+        # series geometry depends on the layout: start over from the buffers
+        self._clear_chart_series()
+
+    def _clear_chart_series(self):
+        """Collapse the polylines/markers and drop the bands; the next sync redraws them."""
+        c = self.chart_canvas
+        for item_id in (self.true_line_id, self.meas_line_id, self.true_head_id, self.meas_head_id):
+            c.coords(item_id, 0, 0, 0, 0)
+        c.delete('pump_band')
+        self._bands.clear()
+        self._bands_first = 0
+        self._bands_total = 0
 
     def _draw_thresholds(self):
         c = self.chart_canvas
-        w = getattr(self, "_chart_w", int(c['width']))
-        h = getattr(self, "_chart_h", int(c['height']))
-        ml = 56; mb = 32
-        high = self.sim.high_sp; low = self.sim.low_sp
-        yH = h - mb - high*2.6
-        yL = h - mb - low*2.6
-        # dashed lines (manual dash segments for portability)
-        for y, color in [(yH, self.COLOR_MEAS), (yL, self.COLOR_PUMP)]:
-            x = ml
-            while x < w-12:
-                c.create_line(x, y, min(x+10, w-12), y, fill=color)
-                x += 16
+        y_off = self._chart_y_off; y_scale = self._chart_y_scale
+        yH = y_off - self.sim.high_sp*y_scale
+        yL = y_off - self.sim.low_sp*y_scale
+        c.coords(self.thresh_high_id, self._chart_x0, yH, self._chart_x1, yH)
+        c.coords(self.thresh_low_id, self._chart_x0, yL, self._chart_x1, yL)
 
     def _draw_chart_series(self):
         c = self.chart_canvas
-        w = getattr(self, "_chart_w", int(c['width']))
-        h = getattr(self, "_chart_h", int(c['height']))
-        ml = 56; mb = 32
-        c.delete('series')
-        if not self.series:
+        if not self._count:
             return
 
-        def x_pos(i): return ml + i * ((w-ml-12)/self.max_pts)
-        def y_level(v): return h - mb - v*2.6
-
-        # Draw markers first (so movement is visible from sample #1)
-        for i, s in enumerate(self.series):
-            x = x_pos(i); y_true = y_level(s['level']); y_meas = y_level(s['measured'])
-            c.create_oval(x-2, y_true-2, x+2, y_true+2, fill=self.COLOR_TRUE, outline='', tags='series')
-            c.create_oval(x-2, y_meas-2, x+2, y_meas+2, fill=self.COLOR_MEAS, outline='', tags='series')
-
-        # Then draw polyline segments
-        last_true = None
-        last_meas = None
-        for i, s in enumerate(self.series):
-            x = x_pos(i)
-            yT = y_level(s['level'])
-            yM = y_level(s['measured'])
-            if last_true is not None:
-                c.create_line(last_true[0], last_true[1], x, yT, fill=self.COLOR_TRUE, width=2, tags='series')
-            if last_meas is not None:
-                c.create_line(last_meas[0], last_meas[1], x, yM, fill=self.COLOR_MEAS, width=1, tags='series')
-            last_true = (x, yT)
-            last_meas = (x, yM)
-
-        # Pump ON bands (simulate translucency with stipple)
-        band_width = (w-ml-12)/self.max_pts
-        for i, s in enumerate(self.series):
-            if s['pump_on']:
-                x = x_pos(i)
-                c.create_rectangle(x, h-mb, x + band_width, h-mb-18,
-                                   fill=self.COLOR_PUMP, outline='',
-                                   stipple='gray50',
-                                   tags='series')
+        # Layout constants cached by _layout_chart_axes
+        ml = self._chart_x0
+        xstep = self._chart_step_x
+        yscale = self._chart_y_scale
+        y0 = self._chart_y_off
+        n = self._count
+        xs = self._xs[:n]
+        ys_true = y0 - self._ordered(self.series_level)*yscale
+        ys_meas = y0 - self._ordered(self.series_meas)*yscale
+
+        # Update the two polylines in one coords call each. With more than two
+        # samples per plot pixel, pool each pixel-wide block to its min/max
+        # (M4-style) so the line keeps its envelope with 2 vertices per column.
+        plot_px = int(self._chart_x1 - self._chart_x0)
+        pooled = n > 2*plot_px > 0
+        if pooled:
+            starts = np.arange(0, n, -(-n // plot_px))
+            line_xs = np.repeat(xs[starts], 2)
+        for line_id, ys in ((self.true_line_id, ys_true), (self.meas_line_id, ys_meas)):
+            if pooled:
+                line_ys = np.empty(2*len(starts))
+                line_ys[0::2] = np.minimum.reduceat(ys, starts)
+                line_ys[1::2] = np.maximum.reduceat(ys, starts)
+            else:
+                line_xs, line_ys = xs, ys
+            flat = np.empty(2*len(line_xs))
+            flat[0::2] = line_xs
+            flat[1::2] = line_ys
+            if len(line_xs) == 1:
+                flat = np.tile(flat, 2)  # a line item needs two vertices
+            c.coords(line_id, *flat.tolist())
+
+        # Markers on the newest sample only
+        x = float(xs[-1]); y_true = float(ys_true[-1]); y_meas = float(ys_meas[-1])
+        c.coords(self.true_head_id, x-2, y_true-2, x+2, y_true+2)
+        c.coords(self.meas_head_id, x-2, y_meas-2, x+2, y_meas+2)
+
+        # Pump ON bands (solid pale fill kept under the lines), run-length encoded:
+        # scroll the existing rects, drop/clip runs leaving the window, and add or
+        # extend rects only for the new samples
+        first = self._total - n  # absolute index of the oldest visible sample
+        shift = first - self._bands_first
+        if shift and self._bands:
+            c.move('pump_band', -shift*xstep, 0)
+        while self._bands and self._bands[0][1] <= first:
+            c.delete(self._bands.popleft()[2])
+        if self._bands and self._bands[0][0] < first:
+            self._bands[0][0] = first  # clip the run scrolling out at the y-axis
+            self._place_band(self._bands[0], first, xstep, y0)
+        new_from = max(self._bands_total, first)
+        pump = self._ordered(self.series_pump)[new_from - first:]
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], pump, [0]))))
+        created = False
+        for a, b in edges.reshape(-1, 2).tolist():
+            a += new_from; b += new_from
+            if self._bands and self._bands[-1][1] == a:
+                self._bands[-1][1] = b  # the newest run continues
+                self._place_band(self._bands[-1], first, xstep, y0)
+            else:
+                band_id = c.create_rectangle(ml + (a - first)*xstep, y0, ml + (b - first)*xstep, y0-18,
+                                             fill=self.COLOR_PUMP_BAND, outline='',
+                                             tags='pump_band')
+                self._bands.append([a, b, band_id])
+                created = True
+        if created:
+            # below the setpoint lines (and so below the polylines, created after them)
+            c.tag_lower('pump_band', 'thresh')
+        self._bands_first = first
+        self._bands_total = self._total
+
+    def _place_band(self, band, first, xstep, y0):
+        """Position one pump-band rect from its [start, end, id] run."""
+        ml = self._chart_x0
+        self.chart_canvas.coords(band[2], ml + (band[0] - first)*xstep, y0, ml + (band[1] - first)*xstep, y0-18)
+
+    def _push_sample(self, s):
+        """Write one sample into the series ring buffers (slot and its mirror)."""
+        i = self._head; j = i + self.max_pts
+        self.series_level[i] = self.series_level[j] = s['level']
+        self.series_meas[i] = self.series_meas[j] = s['measured']
+        self.series_pump[i] = self.series_pump[j] = s['pump_on']
+        self._head = (self._head + 1) % self.max_pts
+        self._count = min(self._count + 1, self.max_pts)
+        self._total += 1
+
+    def _ordered(self, buf):
+        """Return the valid part of a ring buffer, oldest sample first, as a view (no copy)."""
+        start = self._head if self._count == self.max_pts else 0
+        return buf[start:start + self._count]
 
     # -------------------- Tank Drawing --------------------
     def _draw_tank_static(self):
         c = self.tank_canvas
         c.delete('all')
         self.tank_rect = (80, 70, 280, 500)  # left, top, right, bottom
+        self._tank_height = self.tank_rect[3] - self.tank_rect[1]
+        self._tank_marks_sp = None  # setpoints the cached marker y's were computed for
         c.create_rectangle(*self.tank_rect, outline='#666666', width=2)
         # labels
         c.create_text(24, 24, text='High', fill=self.COLOR_MEAS, anchor='w')
         c.create_text(24, 44, text='Low',  fill=self.COLOR_PUMP, anchor='w')
+        # Live items, created once and only moved/re-texted by _draw_tank_level
+        l, t, r, b = self.tank_rect
+        self.level_rect_id = c.create_rectangle(l+1, b-1, r-1, b-1, fill='#80d4ff', outline='', tags='level')
+        self.mark_high_id = c.create_line(0, 0, 0, 0, fill=self.COLOR_MEAS, dash=(10, 6), tags='marks')
+        self.mark_low_id = c.create_line(0, 0, 0, 0, fill=self.COLOR_PUMP, dash=(10, 6), tags='marks')
+        self.level_text_id = c.create_text((l+r)//2, b-13, text='', fill='#0f172a', tags='leveltext')
 
     def _draw_tank_level(self, level, high_sp, low_sp):
         c = self.tank_canvas
         l, t, r, b = self.tank_rect
-        c.delete('level'); c.delete('marks'); c.delete('leveltext')
-        hgt = (level/100.0) * (b - t); y = b - hgt
-        c.create_rectangle(l+1, y, r-1, b-1, fill='#80d4ff', outline='', tags='level')
-        # dashed markers
-        def dashed(y, color):
-            x = l + 2
-            while x < r - 2:
-                c.create_line(x, y, min(x+10, r-2), y, fill=color, tags='marks')
-                x += 16
-        yH = b - (high_sp/100.0) * (b - t)
-        yL = b - (low_sp/100.0)  * (b - t)
-        dashed(yH, self.COLOR_MEAS); dashed(yL, self.COLOR_PUMP)
-        c.create_text((l+r)//2, y-12, text=f"{level:.1f}%", fill='#0f172a', tags='leveltext')
+        y = b - level*0.01*self._tank_height
+        c.coords(self.level_rect_id, l+1, y, r-1, b-1)
+        # dashed markers only move when a setpoint changes
+        if self._tank_marks_sp != (high_sp, low_sp):
+            self._tank_marks_sp = (high_sp, low_sp)
+            self._yH_tank = b - high_sp*0.01*self._tank_height
+            self._yL_tank = b - low_sp*0.01*self._tank_height
+            c.coords(self.mark_high_id, l+2, self._yH_tank, r-2, self._yH_tank)
+            c.coords(self.mark_low_id, l+2, self._yL_tank, r-2, self._yL_tank)
+        c.coords(self.level_text_id, (l+r)//2, y-12)
+        c.itemconfigure(self.level_text_id, text=f"{level:.1f}%")
 
     # -------------------- DPDT visual & animation (on wiring canvas) --------------------
     def _update_dpdt_view(self, s):
@@ -569,7 +1010,9 @@ class App(tk.Tk):
         # target position: 1.0 => NO side, 0.0 => NC side
         self.dpdt_target = 1.0 if coil_on else 0.0
         # update pump contact selection visually if var changed
-        self.sim.dpdt.pump_contact = self.var_pump.get()
+        if self.sim.dpdt.pump_contact != self._cfg.pump_contact:
+            with self._sim_lock:
+                self.sim.dpdt.pump_contact = self._cfg.pump_contact
         # trigger animator if not running
         if not self.dpdt_animating:
             self.dpdt_animating = True
@@ -585,63 +1028,49 @@ class App(tk.Tk):
         else:
             self.dpdt_pos = max(self.dpdt_pos - step, self.dpdt_target)
 
-        # Draw dynamic parts with tag 'dpdt_state' so we can refresh easily
+        # Move/recolor the persistent dynamic items (see _create_dpdt_items)
         c = self.wiring_canvas
-        c.delete('dpdt_state')
+        items = self.dpdt_items
 
-        # draw lever lines for both poles, pivoting at COM and reaching toward NC<->NO
+        # lever lines for both poles, pivoting at COM and reaching toward NC<->NO
+        touching_nc = self.dpdt_pos <= 0.02
+        touching_no = self.dpdt_pos >= 0.98
         for pole_name in ('upper', 'lower'):
             coords = self.dpdt_coords.get(pole_name)
-            if not coords:
+            if not coords or pole_name not in items:
                 continue
-            x_nc, y_nc = coords['nc']
+            x_nc, _ = coords['nc']
             x_com, y_com = coords['com']
-            x_no, y_no = coords['no']
+            x_no, _ = coords['no']
             # target x for lever end based on dpdt_pos interpolation between nc and no
             end_x = x_nc + (x_no - x_nc) * self.dpdt_pos
-            # draw the lever (pivot at COM)
-            c.create_line(x_com, y_com, end_x, y_com, fill='#7b5e57', width=3, capstyle='round', tags=('dpdt_state',))
-            # pivot knob
-            c.create_oval(x_com-4, y_com-4, x_com+4, y_com+4, fill='#7b5e57', outline='', tags=('dpdt_state',))
+            c.coords(items[pole_name]['lever'], x_com, y_com, end_x, y_com)
             # show a filled contact circle if lever is touching (pos near 0 or 1)
-            touching_nc = self.dpdt_pos <= 0.02
-            touching_no = self.dpdt_pos >= 0.98
-            c.create_oval(x_nc-6, y_nc-6, x_nc+6, y_nc+6,
-                          outline='#666666', fill=(self.COLOR_PUMP if touching_nc else '#ffffff'), tags=('dpdt_state',))
-            c.create_oval(x_no-6, y_no-6, x_no+6, y_no+6,
-                          outline='#666666', fill=(self.COLOR_PUMP if touching_no else '#ffffff'), tags=('dpdt_state',))
-            c.create_oval(x_com-6, y_com-6, x_com+6, y_com+6,
-                          outline='#666666', fill='#ffffff', tags=('dpdt_state',))
-
-        # Draw coil energized indicator
-        coil_x, coil_y = self.dpdt_coords.get('coil', (0,0))
+            c.itemconfigure(items[pole_name]['nc'], fill=(self.COLOR_PUMP if touching_nc else '#ffffff'))
+            c.itemconfigure(items[pole_name]['no'], fill=(self.COLOR_PUMP if touching_no else '#ffffff'))
+
+        # coil energized indicator
         coil_on = bool(self.sim.coil_on)
-        c.create_rectangle(coil_x-46, coil_y-16, coil_x+46, coil_y+16,
-                           outline='#666666', fill=('#ffcccb' if coil_on else '#ffffff'),
-                           tags=('dpdt_state',))
-        c.create_text(coil_x, coil_y, text='COIL', fill=self.COLOR_TEXT, tags=('dpdt_state',))
+        if 'coil' in items:
+            c.itemconfigure(items['coil'], fill=('#ffcccb' if coil_on else '#ffffff'))
 
-        # Draw wiring from pump terminal to the contact the pump is attached to.
+        # Wiring from pump terminal to the contact the pump is attached to.
         pump_x, pump_y = self.dpdt_coords.get('pump_term', (0,0))
         lower_coords = self.dpdt_coords.get('lower')
-        if lower_coords:
+        if lower_coords and 'wire' in items:
             pump_contact = self.sim.dpdt.pump_contact
             contact_point = lower_coords['nc'] if pump_contact == 'NC' else lower_coords['no']
             com_point = lower_coords['com']
             pump_on = self.sim.dpdt.pump_on(self.sim.coil_on)
             wire_color = (self.COLOR_PUMP if pump_on else '#999999')
-            # wire from pump terminal to chosen contact (curved via two segments for clarity)
             # pump -> contact
-            c.create_line(pump_x+30, pump_y, contact_point[0]-8, contact_point[1], fill=wire_color, width=3, tags=('dpdt_state',), smooth=True)
+            c.coords(items['wire'], pump_x+30, pump_y, contact_point[0]-8, contact_point[1])
+            c.itemconfigure(items['wire'], fill=wire_color)
             # COM->contact (dashed)
-            c.create_line(com_point[0], com_point[1], contact_point[0], contact_point[1], fill='#bbbbbb', dash=(3,3), tags=('dpdt_state',))
-            # highlight pump body border when energized
-            pump_body_fill = '#ccffdd' if pump_on else '#eeeeee'
-            c.create_rectangle(pump_x+10, pump_y-12, pump_x+60, pump_y+12,
-                               outline='#666666', fill=pump_body_fill, tags=('dpdt_state',))
-            c.create_oval(pump_x+60, pump_y-10, pump_x+80, pump_y+10,
-                          outline='#666666', fill=('#bbffbb' if pump_on else '#dddddd'), tags=('dpdt_state',))
-            c.create_text(pump_x+46, pump_y+32, text='Pump', fill=self.COLOR_TEXT, tags=('dpdt_state',))
+            c.coords(items['com_wire'], com_point[0], com_point[1], contact_point[0], contact_point[1])
+            # highlight pump body when energized
+            c.itemconfigure(items['pump_body'], fill=('#ccffdd' if pump_on else '#eeeeee'))
+            c.itemconfigure(items['pump_head'], fill=('#bbffbb' if pump_on else '#dddddd'))
 
         # Stop animation if we reached target, else schedule another frame
         if abs(self.dpdt_pos - self.dpdt_target) < 0.001:
@@ -651,21 +1080,31 @@ class App(tk.Tk):
             self.after(40, self._animate_dpdt)
 
     # -------------------- Status --------------------
+    def _set(self, widget, attr, val):
+        """Configure a widget option only when its value actually changed."""
+        key = (id(widget), attr)
+        if self._last_status.get(key) != val:
+            widget.configure(**{attr: val})
+            self._last_status[key] = val
+
     def _update_status(self, s):
-        self.lbl_level.configure(text=f"Level: {s['level']:.2f}%")
-        self.lbl_meas.configure(text=f"Measured: {s['measured']:.2f}%")
-        self.lbl_high.configure(text=f"High: {'CLOSED' if s['high_closed'] else 'open'}")
-        self.lbl_low.configure(text=f"Low: {'CLOSED' if s['low_closed'] else 'open'}")
-        self.lbl_coil.configure(text=f"Coil: {'ENERGIZED' if s['coil_on'] else 'de-energized'}")
-        self.lbl_pump.configure(text=f"Pump: {'ON' if s['pump_on'] else 'OFF'}")
+        # Compared after formatting, so jitter below the displayed 0.01% is free
+        self._set(self.lbl_status, 'text', (
+            f"Level: {s['level']:.2f}%\n"
+            f"Measured: {s['measured']:.2f}%\n"
+            f"High: {'CLOSED' if s['high_closed'] else 'open'}\n"
+            f"Low: {'CLOSED' if s['low_closed'] else 'open'}\n"
+            f"Coil: {'ENERGIZED' if s['coil_on'] else 'de-energized'}\n"
+            f"Pump: {'ON' if s['pump_on'] else 'OFF'}"
+        ))
         # LED color
-        self.pump_led.itemconfig(
-            self.pump_led_id,
-            fill=(self.COLOR_PUMP if s['pump_on'] else '#ef4444'),
-            outline=('#1f7a1f' if s['pump_on'] else '#7f1d1d')
-        )
-        # Ensure the dpdt visualization is in sync (starts/continues animation if required)
-        self._update_dpdt_view(s)
+        pump_on = bool(s['pump_on'])
+        if self._last_status.get('led') != pump_on:
+            if 'led' not in self._last_status:
+                self.pump_led.itemconfig(self.pump_led_id, state='hidden')  # idle grey, until the first sample
+            self.pump_led.itemconfig(self._led_on, state='normal' if pump_on else 'hidden')
+            self.pump_led.itemconfig(self._led_off, state='hidden' if pump_on else 'normal')
+            self._last_status['led'] = pump_on
 
     # -------------------- Help / How it works --------------------
     def show_help(self):
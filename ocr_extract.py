@@ -4,10 +4,12 @@ ocr_extract.py
 
 Usage:
   python ocr_extract.py input_image.png output.json
+  python ocr_extract.py <directory | "glob*.png" | img1.png img2.png ...> output_dir/
+    (batch: all images are OCR'd by one Tesseract process; one JSON per image)
 
 What it does (prototype):
- - Preprocess the image (grayscale, blur, adaptive threshold)
- - Attempt to find the largest rectangular contour (assumed part outline)
+ - Preprocess the image (grayscale, adaptive mean threshold)
+ - Attempt to find the largest connected outline (assumed part outline)
  - Run pytesseract to extract text boxes
  - Parse common dimension patterns:
      - LxW, L x W x H, L×W×H
@@ -18,112 +20,424 @@ What it does (prototype):
 
 Limitations: heuristics only. Review JSON before 3D generation.
 """
+import os
 import sys
+import atexit
+import glob
 import json
 import re
+import queue
+import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 import cv2
 import numpy as np
 import pytesseract
 from pytesseract import Output
 
+try:
+    # RE2 matches in linear time with no backtracking; same API as `re`
+    import re2 as re_dfa
+except ImportError:
+    re_dfa = re
+
+try:
+    # In-process Tesseract: the engine and language model load once per process
+    # instead of once per pytesseract subprocess call
+    from PIL import Image
+    from tesserocr import PyTessBaseAPI, PSM, OEM, RIL, iterate_level
+except ImportError:
+    PyTessBaseAPI = None
+
+try:
+    # Rust JSON encoder: much faster than json.dump on long hole lists, numpy-aware
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from numba import get_num_threads, njit, prange
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
 # ---------------------
 # helpers / regex
 # ---------------------
-DIM_SEP_PATTERN = re.compile(r'[\sx×X*:,]+')  # separators between dims
 FLOAT_RE = r'[-+]?\d*\.\d+|\d+'
-UNIT_RE = r'(mm|cm|m|in|")?'
-# examples: "100x50x25 mm" or "100 × 50 × 25"
-TRIPLE_DIM_RE = re.compile(rf'({FLOAT_RE})\s*[x×X,]\s*({FLOAT_RE})\s*[x××X,]\s*({FLOAT_RE})\s*{UNIT_RE}', re.IGNORECASE)
-DOUBLE_DIM_RE = re.compile(rf'({FLOAT_RE})\s*[x×X,]\s*({FLOAT_RE})\s*{UNIT_RE}', re.IGNORECASE)
-SINGLE_DIM_RE = re.compile(rf'({FLOAT_RE})\s*{UNIT_RE}', re.IGNORECASE)
-HOLE_RE = re.compile(r'(?:Ø|ø|phi|phi:|DIA|dia|φ)\s*({FLOAT_RE})', re.IGNORECASE)
+UNIT_RE = r'mm|cm|m|in|"'
+HOLE_PREFIX_RE = r'(?:Ø|ø|phi|phi:|DIA|dia|φ)'
+# All dimension patterns as one alternation, so the OCR text is scanned once;
+# earlier alternatives win at a given position (L x W x H before L x W before a
+# hole callout before a lone number). Examples: "100x50x25 mm", "100 × 50 × 25".
+# Compiled with RE2 when available (inline (?i) works for both engines).
+DIM_RE = re_dfa.compile(
+    rf'(?i)(?P<triple>(?P<t1>{FLOAT_RE})\s*[x×X,]\s*(?P<t2>{FLOAT_RE})\s*[x×X,]\s*(?P<t3>{FLOAT_RE})\s*(?P<tu>{UNIT_RE})?)'
+    rf'|(?P<double>(?P<d1>{FLOAT_RE})\s*[x×X,]\s*(?P<d2>{FLOAT_RE})\s*(?P<du>{UNIT_RE})?)'
+    rf'|(?P<hole>{HOLE_PREFIX_RE}\s*(?P<h1>{FLOAT_RE}))'
+    rf'|(?P<single>(?P<s1>{FLOAT_RE})\s*(?P<su>{UNIT_RE})?)')
+# the number groups of each DIM_RE alternative, in order
+NUM_GROUPS = {'triple': ('t1', 't2', 't3'), 'double': ('d1', 'd2'), 'hole': ('h1',), 'single': ('s1',)}
+
+# OCR accuracy plateaus around this size while Tesseract's runtime keeps growing
+# with pixel count, so larger images are shrunk (longest side) before OCR
+MAX_OCR_DIM = 1500
+OCR_TIMEOUT_S = 10  # per image; guards against Tesseract hanging on a bad input
+# Drawings carry sparse text: PSM 11 (sparse text, no page layout analysis), LSTM
+# engine only, English model, and only the characters the parser above can use
+# (digits, separators, hole prefixes, unit letters). The whitelist contains no
+# spaces or quotes so pytesseract's shlex split keeps it as one argument; inch
+# marks (") are therefore not recognised, 'in' is.
+TESS_WHITELIST = '0123456789.,:-+xX×*Øøφ' + 'mMcCiInNdDaAhHpP'
+TESS_CONFIG = f'--psm 11 --oem 1 -l eng -c tessedit_char_whitelist={TESS_WHITELIST}'
+# Drawings bigger than this are OCR'd at full resolution in overlapping tiles
+# spread over a thread pool instead of being shrunk to MAX_OCR_DIM, where their
+# small callouts would become unreadable. Words repeated in two tiles' overlap
+# are dropped when their boxes overlap by more than OCR_TILE_IOU.
+TILED_OCR_MIN_DIM = 3000
+OCR_TILE = MAX_OCR_DIM
+OCR_TILE_OVERLAP = 100
+OCR_TILE_IOU = 0.5
+# Tile OCR threads: each Tesseract already uses several threads (and the pytesseract
+# fallback is one process per worker), so a few workers saturate the machine
+OCR_MAX_WORKERS = min(4, os.cpu_count() or 1)
 
 # ---------------------
 # image preprocessing
 # ---------------------
-def preprocess(img):
-    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-    # adaptive threshold to handle various backgrounds
-    blur = cv2.GaussianBlur(gray, (3,3), 0)
-    th = cv2.adaptiveThreshold(blur, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
-                               cv2.THRESH_BINARY_INV, 25, 10)
+ADAPTIVE_BLOCK = 25  # adaptive-threshold window (px)
+ADAPTIVE_C = 10      # offset below the local mean
+# OpenCV's SIMD box filter is ~2x faster than the Numba kernel on one thread;
+# the kernel only pays off when its rows can spread over several cores
+PARALLEL_THRESHOLD_MIN_THREADS = 3
+
+if _NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _mean_adaptive_threshold(gray, block, c, out):
+        """
+        Inverted mean adaptive threshold (255 where gray <= local mean - c) over a
+        block x block window with replicated borders. Horizontal window sums are
+        running sums per row and vertical ones slide down chunks of rows, both run
+        in parallel. The 8-bit mean is rounded like OpenCV's boxFilter, so
+        output matches adaptiveThreshold(..., ADAPTIVE_THRESH_MEAN_C, ...) exactly.
+        """
+        h, w = gray.shape
+        r = block // 2
+        area = block * block
+        half = area // 2
+        hsum = np.empty((h, w), np.int32)
+        for y in prange(h):
+            s = 0
+            for k in range(-r, r + 1):
+                s += gray[y, min(max(k, 0), w - 1)]
+            hsum[y, 0] = s
+            for x in range(1, w):
+                s += np.int32(gray[y, min(x + r, w - 1)]) - np.int32(gray[y, max(x - r - 1, 0)])
+                hsum[y, x] = s
+        # vertical pass: each chunk of rows seeds one window sum, then slides it
+        chunk = 64
+        for ci in prange((h + chunk - 1) // chunk):
+            y0 = ci * chunk
+            acc = np.zeros(w, np.int32)
+            for k in range(-r, r + 1):
+                yy = min(max(y0 + k, 0), h - 1)
+                for x in range(w):
+                    acc[x] += hsum[yy, x]
+            for y in range(y0, min(y0 + chunk, h)):
+                if y > y0:
+                    ya = min(y + r, h - 1)
+                    yb = max(y - r - 1, 0)
+                    for x in range(w):
+                        acc[x] += hsum[ya, x] - hsum[yb, x]
+                # gray <= round(acc / area) - c, without the division (area is odd: no ties)
+                for x in range(w):
+                    out[y, x] = 255 if (np.int32(gray[y, x]) + c) * area <= acc[x] + half else 0
+        return out
+
+    # compile (or load from cache) now rather than on the first real image
+    _mean_adaptive_threshold(np.zeros((64, 64), np.uint8), ADAPTIVE_BLOCK, ADAPTIVE_C,
+                             np.empty((64, 64), np.uint8))
+
+def preprocess(gray):
+    # images are loaded with IMREAD_GRAYSCALE; convert only if a colour image was passed in
+    if gray.ndim == 3:
+        gray = cv2.cvtColor(gray, cv2.COLOR_BGR2GRAY)
+    if _NUMBA_AVAILABLE and get_num_threads() >= PARALLEL_THRESHOLD_MIN_THREADS:
+        return gray, _mean_adaptive_threshold(gray, ADAPTIVE_BLOCK, ADAPTIVE_C, np.empty_like(gray))
+    # adaptive threshold to handle various backgrounds; the box mean already smooths,
+    # so no separate blur pass
+    th = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_MEAN_C,
+                               cv2.THRESH_BINARY_INV, ADAPTIVE_BLOCK, ADAPTIVE_C)
     return gray, th
 
 def find_largest_rect(thresh):
-    # find contours and choose the largest quadrilateral-like contour
-    contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-    best = None
-    best_area = 0
-    for c in contours:
-        area = cv2.contourArea(c)
-        if area < 1000:
-            continue
-        peri = cv2.arcLength(c, True)
-        approx = cv2.approxPolyDP(c, 0.02 * peri, True)
-        if len(approx) >= 4 and area > best_area:
-            best = approx
-            best_area = area
-    if best is None:
+    # the part outline is taken to be the connected component with the largest
+    # bounding box; one C call gives every component's bbox, so no contour
+    # tracing or polygon fitting is needed for the (x,y,w,h) we return
+    n, _, stats, _ = cv2.connectedComponentsWithStats(thresh, connectivity=8)
+    if n < 2:
+        return None
+    bbox_area = stats[1:, cv2.CC_STAT_WIDTH].astype(np.int64) * stats[1:, cv2.CC_STAT_HEIGHT]
+    k = int(np.argmax(bbox_area))
+    if bbox_area[k] < 1000:
         return None
-    # return bounding rect (x,y,w,h)
-    x, y, w, h = cv2.boundingRect(best)
+    x, y, w, h = stats[k + 1, :4].tolist()
     return (x, y, w, h)
 
 # ---------------------
 # OCR + parse
 # ---------------------
-def ocr_with_boxes(img):
-    # use pytesseract to get boxes
-    d = pytesseract.image_to_data(img, output_type=Output.DICT)
-    boxes = []
-    n = len(d['text'])
-    for i in range(n):
-        text = d['text'][i].strip()
-        if text == '':
+def downscale_for_ocr(img):
+    """Shrink img so its longest side is at most MAX_OCR_DIM; returns (image, scale)."""
+    h, w = img.shape[:2]
+    if max(h, w) <= MAX_OCR_DIM:
+        return img, 1.0
+    scale = MAX_OCR_DIM / max(h, w)
+    return cv2.resize(img, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA), scale
+
+_OCR_IDLE = queue.LifoQueue()  # tesserocr engines not in use, shared by all threads and calls
+_OCR_ENGINES = []              # every engine created, for the exit hook
+_OCR_EXECUTOR = None           # tile thread pool, created on first tiled image
+_OCR_LOCK = threading.Lock()
+
+@contextmanager
+def _ocr_api():
+    """
+    Borrow a tesserocr engine configured like TESS_CONFIG (an engine must not be
+    used by two threads at once). Engines go back to a shared pool, so at most
+    one per concurrent OCR call (OCR_MAX_WORKERS + the main thread) is ever built.
+    """
+    try:
+        api = _OCR_IDLE.get_nowait()
+    except queue.Empty:
+        api = PyTessBaseAPI(lang='eng', psm=PSM.SPARSE_TEXT, oem=OEM.LSTM_ONLY)
+        api.SetVariable('tessedit_char_whitelist', TESS_WHITELIST)
+        with _OCR_LOCK:
+            _OCR_ENGINES.append(api)
+    try:
+        yield api
+    finally:
+        _OCR_IDLE.put(api)
+
+def _ocr_executor():
+    global _OCR_EXECUTOR
+    with _OCR_LOCK:
+        if _OCR_EXECUTOR is None:
+            _OCR_EXECUTOR = ThreadPoolExecutor(max_workers=OCR_MAX_WORKERS)
+        return _OCR_EXECUTOR
+
+@atexit.register
+def _shutdown_ocr():
+    if _OCR_EXECUTOR is not None:
+        _OCR_EXECUTOR.shutdown(wait=True)
+    for api in _OCR_ENGINES:
+        api.End()
+    _OCR_ENGINES.clear()
+
+def _tesserocr_data(img):
+    """Word-level OCR via tesserocr, in the same dict layout as pytesseract's image_to_data."""
+    with _ocr_api() as api:
+        return _tesserocr_recognize(api, img)
+
+def _tesserocr_recognize(api, img):
+    rgb = img if img.ndim == 2 else np.ascontiguousarray(img[..., ::-1])  # cv2 BGR -> RGB
+    api.SetImage(Image.fromarray(rgb))
+    api.Recognize()
+    d = {'text': [], 'conf': [], 'left': [], 'top': [], 'width': [], 'height': []}
+    ri = api.GetIterator()
+    if ri is None:
+        return d
+    for word in iterate_level(ri, RIL.WORD):
+        box = word.BoundingBox(RIL.WORD)
+        if box is None:
             continue
-        conf = int(d['conf'][i]) if d['conf'][i].isdigit() else -1
-        x, y, w, h = d['left'][i], d['top'][i], d['width'][i], d['height'][i]
-        boxes.append({'text': text, 'conf': conf, 'bbox': [x,y,w,h]})
+        x1, y1, x2, y2 = box
+        d['text'].append(word.GetUTF8Text(RIL.WORD) or '')
+        d['conf'].append(word.Confidence(RIL.WORD))
+        d['left'].append(x1); d['top'].append(y1)
+        d['width'].append(x2 - x1); d['height'].append(y2 - y1)
+    return d
+
+def _ocr_data(img):
+    # tesserocr (in-process, engines pooled across calls) when installed, else a
+    # pytesseract subprocess; both release the GIL while Tesseract runs
+    if PyTessBaseAPI is not None:
+        return _tesserocr_data(img)
+    return pytesseract.image_to_data(img, output_type=Output.DICT, config=TESS_CONFIG,
+                                     timeout=OCR_TIMEOUT_S)
+
+def ocr_with_boxes(img):
+    # OCR a downscaled copy; bboxes come back in img pixels
+    ocr_img, scale = downscale_for_ocr(img)
+    d = _ocr_data(ocr_img)
+    return _pack_boxes(d, range(len(d['text'])), scale)
+
+def _tile_origins(size, tile, overlap):
+    """Start offsets of tiles covering 0..size, consecutive tiles sharing overlap px."""
+    if size <= tile:
+        return [0]
+    starts = list(range(0, size - tile, tile - overlap))
+    return starts + [size - tile]
+
+def _iter_tiles(img, tile, overlap):
+    """Yield (y, x, tile_img) views covering img."""
+    h, w = img.shape[:2]
+    for y in _tile_origins(h, tile, overlap):
+        for x in _tile_origins(w, tile, overlap):
+            yield y, x, img[y:y+tile, x:x+tile]
+
+def _ocr_tile(y, x, tile_img):
+    d = _ocr_data(np.ascontiguousarray(tile_img))
+    boxes = _pack_boxes(d, range(len(d['text'])))
+    boxes['bbox'][:, 0] += x
+    boxes['bbox'][:, 1] += y
     return boxes
 
+def _box_iou(a, b):
+    """IoU of every x,y,w,h box in a (n, 4) against every box in b (m, 4); returns (n, m)."""
+    a = a.astype(np.int64)[:, None, :]
+    b = b.astype(np.int64)[None, :, :]
+    iw = np.minimum(a[..., 0] + a[..., 2], b[..., 0] + b[..., 2]) - np.maximum(a[..., 0], b[..., 0])
+    ih = np.minimum(a[..., 1] + a[..., 3], b[..., 1] + b[..., 3]) - np.maximum(a[..., 1], b[..., 1])
+    inter = np.clip(iw, 0, None) * np.clip(ih, 0, None)
+    union = a[..., 2] * a[..., 3] + b[..., 2] * b[..., 3] - inter
+    return inter / np.maximum(union, 1)
+
+def ocr_with_boxes_tiled(img, tile=OCR_TILE, overlap=OCR_TILE_OVERLAP):
+    """
+    OCR a large image at full resolution as overlapping tiles, one Tesseract
+    call per tile on a thread pool. Returns the same column dict as
+    ocr_with_boxes, in tile order, with words seen twice in an overlap kept once.
+    """
+    parts = list(_ocr_executor().map(lambda t: _ocr_tile(*t), _iter_tiles(img, tile, overlap)))
+    kept = []
+    kept_bbox = np.empty((0, 4), np.int32)
+    for boxes in parts:
+        if len(kept_bbox) and len(boxes['bbox']):
+            fresh = _box_iou(boxes['bbox'], kept_bbox).max(axis=1) <= OCR_TILE_IOU
+            boxes = {k: v[fresh] for k, v in boxes.items()}
+        kept.append(boxes)
+        kept_bbox = np.concatenate([kept_bbox, boxes['bbox']])
+    return {k: np.concatenate([b[k] for b in kept]) for k in ('text', 'conf', 'bbox')}
+
+def ocr_with_boxes_batch(img_paths, imgs=None):
+    """
+    OCR several image files in one Tesseract run (one process / model load for
+    the whole batch) via a list file. Returns one box list per input path.
+    If the loaded images are passed too, oversized ones are OCR'd from a
+    downscaled temporary copy and their bboxes mapped back to full size.
+    With tesserocr installed the images simply go through the shared engine.
+    """
+    if PyTessBaseAPI is not None:
+        if imgs is None:
+            imgs = [cv2.imread(p, cv2.IMREAD_GRAYSCALE) for p in img_paths]
+        return [ocr_with_boxes(img) for img in imgs]
+    tmp_dir = tempfile.mkdtemp()
+    ocr_paths = []
+    scales = []
+    for k, p in enumerate(img_paths):
+        ocr_img, scale = downscale_for_ocr(imgs[k]) if imgs is not None else (None, 1.0)
+        if scale != 1.0:
+            p = os.path.join(tmp_dir, f'{k}.png')
+            cv2.imwrite(p, ocr_img)
+        ocr_paths.append(os.path.abspath(p))
+        scales.append(scale)
+    list_path = os.path.join(tmp_dir, 'images.txt')
+    with open(list_path, 'w') as f:
+        f.write('\n'.join(ocr_paths) + '\n')
+    try:
+        d = pytesseract.image_to_data(list_path, output_type=Output.DICT, config=TESS_CONFIG,
+                                      timeout=OCR_TIMEOUT_S * len(img_paths))
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    rows = [[] for _ in img_paths]
+    for i, page in enumerate(d['page_num']):
+        rows[int(page) - 1].append(i)  # pages are numbered from 1 in list order
+    return [_pack_boxes(d, r, scale) for r, scale in zip(rows, scales)]
+
+def _pack_boxes(d, rows, scale=1.0):
+    """
+    Turn image_to_data rows into column arrays for the non-empty words:
+    {'text': object array, 'conf': int32 (n,), 'bbox': int32 (n, 4) as x,y,w,h}.
+    bboxes are divided by scale to undo downscale_for_ocr.
+    """
+    rows = np.asarray(rows, dtype=np.intp)
+    texts = np.array([t.strip() for t in np.asarray(d['text'], dtype=object)[rows]], dtype=object)
+    nonempty = texts != ''
+    keep = rows[nonempty]
+    try:
+        conf = np.asarray(d['conf'], dtype=np.float64)[keep].astype(np.int32)
+    except ValueError:
+        conf = np.array([_to_conf(d['conf'][i]) for i in keep], dtype=np.int32)
+    bbox = np.column_stack([np.asarray(d[k], dtype=np.float64)[keep]
+                            for k in ('left', 'top', 'width', 'height')])
+    if scale != 1.0:
+        bbox = np.rint(bbox / scale)
+    return {'text': texts[nonempty], 'conf': conf, 'bbox': bbox.astype(np.int32)}
+
+def _to_conf(value):
+    try:
+        return int(float(value))
+    except ValueError:
+        return -1
+
 def parse_dimensions_from_text(boxes, part_bbox=None):
     """
+    boxes is the column dict from ocr_with_boxes ('text', 'conf', 'bbox' arrays).
     Returns a dict: { type: 'box', length, width, height(optional), units, holes: [ {r, x_rel, y_rel } ] }
     Coordinates x_rel,y_rel are in 0..1 relative to part bounding box if available, else pixel coords.
     """
     result = {'type':'box', 'units':'mm', 'holes':[]}
-    # join all texts to try to find combined dims like "100x50x25 mm"
-    all_text = ' '.join(b['text'] for b in boxes)
-    m = TRIPLE_DIM_RE.search(all_text)
-    if m:
-        l, w, h, u = m.group(1), m.group(2), m.group(3), m.group(4)
+    # join all texts to try to find combined dims like "100x50x25 mm", then
+    # collect the first triple/double match and the hole callouts in one scan.
+    # The loose numbers are only a fallback for L,W,H: none are kept once a
+    # triple has matched and at most the first three otherwise.
+    texts = boxes['text'].tolist()
+    all_text = ' '.join(texts)
+    triple = double = None
+    nums = []
+    holes = []
+    for m in DIM_RE.finditer(all_text):
+        kind = m.lastgroup
+        if kind == 'triple':
+            triple = triple or m
+        elif kind == 'hole':
+            holes.append(m)
+        elif kind == 'double':
+            double = double or m
+        if triple is None and len(nums) < 3:
+            nums += [float(m[g]) for g in NUM_GROUPS[kind]]
+    if triple:
+        l, w, h, u = triple['t1'], triple['t2'], triple['t3'], triple['tu']
         result.update({'length':float(l), 'width':float(w), 'height':float(h)})
         if u: result['units'] = u.lower()
     else:
         # try to find double dims (L x W) and single dim for H maybe on separate box
-        m2 = DOUBLE_DIM_RE.search(all_text)
-        if m2:
-            l, w, u = m2.group(1), m2.group(2), m2.group(3)
+        if double:
+            l, w, u = double['d1'], double['d2'], double['du']
             result.update({'length':float(l), 'width':float(w)})
             if u: result['units'] = u.lower()
-        # try single dims (maybe height)
-        singles = SINGLE_DIM_RE.findall(all_text)
-        # map the largest three numbers heuristically to L,W,H
-        nums = [float(s[0]) for s in singles]
+        # map the first three numbers heuristically to L,W,H
+        nums = nums[:3]
         if 'length' not in result and nums:
             result['length'] = nums[0]
         if 'width' not in result and len(nums) > 1:
             result['width'] = nums[1]
         if 'height' not in result and len(nums) > 2:
             result['height'] = nums[2]
-    # find hole specs
-    for b in boxes:
-        t = b['text']
-        mm = HOLE_RE.search(t)
-        if mm:
-            r = float(mm.group(1))
+    # hole specs: map each match back to the box it starts in (offsets are the
+    # end of each box's text plus its joining space); first callout per box
+    offsets = np.cumsum([len(t) + 1 for t in texts])
+    box_of = np.searchsorted(offsets, [m.start() for m in holes], side='right').tolist()
+    seen = set()
+    for mm, i in zip(holes, box_of):
+        if i not in seen:
+            seen.add(i)
+            r = float(mm['h1'])
             # estimate location: use bbox center; map to relative coords if part_bbox present
-            x, y, w, h = b['bbox']
+            x, y, w, h = boxes['bbox'][i].tolist()
             cx = x + w/2
             cy = y + h/2
             if part_bbox:
@@ -139,18 +453,19 @@ def parse_dimensions_from_text(boxes, part_bbox=None):
 # ---------------------
 # main
 # ---------------------
-def main():
-    if len(sys.argv) < 3:
-        print("Usage: python ocr_extract.py input.png output.json")
-        sys.exit(1)
-    img_path = sys.argv[1]
-    out_json = sys.argv[2]
-    img = cv2.imread(img_path)
+def extract(img_path, img=None, boxes=None):
+    """Run the whole pipeline on one image; returns the JSON-ready result or None if unreadable."""
+    if img is None:
+        img = cv2.imread(img_path, cv2.IMREAD_GRAYSCALE)
     if img is None:
-        print("Failed to load image:", img_path); sys.exit(2)
+        return None
     gray, th = preprocess(img)
     part_bbox = find_largest_rect(th)
-    boxes = ocr_with_boxes(img)
+    if boxes is None:
+        if max(img.shape[:2]) > TILED_OCR_MIN_DIM:
+            boxes = ocr_with_boxes_tiled(img)
+        else:
+            boxes = ocr_with_boxes(img)
     parsed = parse_dimensions_from_text(boxes, part_bbox)
     # if we have part bbox, convert relative hole coords to dimension units (approx)
     # but we need scale: if length/width are provided, we can map rel coords to units
@@ -167,12 +482,68 @@ def main():
             else:
                 h['y_mm'] = 0
     # Add bounding info for human review
-    out = {'source_image': img_path, 'part_bbox': part_bbox, 'parsed': parsed}
-    with open(out_json, 'w') as f:
-        json.dump(out, f, indent=2)
-    print("Wrote:", out_json)
-    print("Parsed result (summary):")
-    print(json.dumps(parsed, indent=2))
+    return {'source_image': img_path, 'part_bbox': part_bbox, 'parsed': parsed}
+
+def _write_json(path, out):
+    """Write out as indented JSON (orjson when installed, else the json module)."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(out, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(path, 'w') as f:
+            json.dump(out, f, indent=2)
+
+def _expand_inputs(args):
+    """Expand a directory, glob patterns or explicit paths into a sorted list of image files."""
+    paths = []
+    for arg in args:
+        if os.path.isdir(arg):
+            paths += [os.path.join(arg, n) for n in sorted(os.listdir(arg))
+                      if n.lower().endswith(('.png', '.jpg', '.jpeg', '.tif', '.tiff', '.bmp'))]
+        elif os.path.exists(arg):
+            paths.append(arg)
+        else:
+            paths += sorted(glob.glob(arg))
+    return paths
+
+def main():
+    if len(sys.argv) < 3:
+        print("Usage: python ocr_extract.py input.png output.json")
+        print("       python ocr_extract.py <dir | glob | images...> output_dir/")
+        sys.exit(1)
+    inputs = sys.argv[1:-1]
+    out_path = sys.argv[-1]
+    if len(inputs) == 1 and os.path.isfile(inputs[0]) and not os.path.isdir(out_path):
+        img_path = inputs[0]
+        out = extract(img_path)
+        if out is None:
+            print("Failed to load image:", img_path); sys.exit(2)
+        _write_json(out_path, out)
+        print("Wrote:", out_path)
+        print("Parsed result (summary):")
+        print(json.dumps(out['parsed'], indent=2))
+        return
+
+    # Batch: load everything first, then OCR the readable images in one Tesseract run;
+    # drawings large enough for tiled OCR are left to extract()
+    img_paths = _expand_inputs(inputs)
+    imgs = {}
+    for p in img_paths:
+        img = cv2.imread(p, cv2.IMREAD_GRAYSCALE)
+        if img is None:
+            print("Failed to load image:", p)
+        else:
+            imgs[p] = img
+    if not imgs:
+        print("No readable images in:", ' '.join(inputs)); sys.exit(2)
+    os.makedirs(out_path, exist_ok=True)
+    small = {p: img for p, img in imgs.items() if max(img.shape[:2]) <= TILED_OCR_MIN_DIM}
+    batch_boxes = dict(zip(small, ocr_with_boxes_batch(list(small), list(small.values())))) if small else {}
+    for p, img in imgs.items():
+        out = extract(p, img, batch_boxes.get(p))
+        out_json = os.path.join(out_path, os.path.splitext(os.path.basename(p))[0] + '.json')
+        _write_json(out_json, out)
+        print("Wrote:", out_json)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
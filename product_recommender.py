@@ -1,5 +1,5 @@
+import numpy as np
 import streamlit as st
-from operator import itemgetter
 
 # Define the product database
 product_data = [
@@ -14,23 +14,52 @@ product_data = [
     # Add more products here
 ]
 
-# Extract unique features and applications from the product database
-all_features = sorted({feature for product in product_data for feature in product["Features"]})
-all_applications = sorted({app for product in product_data for app in product["Applications"]})
+def _pack_bits(columns, index):
+    # One bitmask per product over `index`; a single uint64 while it fits, packed bytes beyond 64 entries
+    if len(index) <= 64:
+        return np.array([sum(1 << index[v] for v in col) for col in columns], dtype=np.uint64)
+    rows = np.zeros((len(columns), len(index)), dtype=bool)
+    for p, col in enumerate(columns):
+        rows[p, [index[v] for v in col]] = True
+    return np.packbits(rows, axis=1, bitorder="little")
 
+def _has_bit(bits, i):
+    # 0/1 per product: whether bit `i` is set in its mask
+    if bits.ndim == 1:
+        return ((bits >> np.uint64(i)) & np.uint64(1)).astype(np.int8)
+    return ((bits[:, i >> 3] >> (i & 7)) & 1).astype(np.int8)
+
+@st.cache_resource
+def _build_catalog():
+    # Extract unique features and applications from the product database
+    all_features = sorted({feature for product in product_data for feature in product["Features"]})
+    all_applications = sorted({app for product in product_data for app in product["Applications"]})
+
+    # Columnar copy of product_data: names plus per-product feature / application bitmasks
+    feature_idx = {f: i for i, f in enumerate(all_features)}
+    app_idx = {a: i for i, a in enumerate(all_applications)}
+    names = np.array([product["Name"] for product in product_data], dtype=object)
+    feature_bits = _pack_bits([product["Features"] for product in product_data], feature_idx)
+    app_bits = _pack_bits([product["Applications"] for product in product_data], app_idx)
+    for arr in (names, feature_bits, app_bits):
+        arr.setflags(write=False)  # one copy shared by every session
+    return all_features, all_applications, feature_idx, app_idx, names, feature_bits, app_bits
+
+# Built once per server process and shared by all sessions (cache_resource hands back
+# the same objects instead of unpickling a copy), so reruns and new sessions skip the rebuild
+all_features, all_applications, feature_idx, app_idx, names, feature_bits, app_bits = _build_catalog()
+
+@st.cache_data
 def recommend_products(selected_feature, selected_application):
-    # Calculate scores for each product
-    scores = []
-    for product in product_data:
-        score = 0
-        if selected_feature in product["Features"]:
-            score += 1
-        if selected_application in product["Applications"]:
-            score += 1
-        scores.append((product["Name"], score))
-
-    # Sort products by score (descending) and take the top 3
-    top_products = sorted(scores, key=itemgetter(1), reverse=True)[:3]
+    # Score every product at once: one point per matching feature / application bit
+    scores = _has_bit(feature_bits, feature_idx[selected_feature]) + _has_bit(app_bits, app_idx[selected_application])
+
+    # Partial-select the top 3 by score (descending, ties keep catalog order), then order just those
+    key = np.arange(len(scores)) - scores.astype(np.int64) * len(scores)
+    k = min(3, len(key))
+    top = np.argpartition(key, k - 1)[:k] if k < len(key) else np.arange(len(key))
+    top = top[np.argsort(key[top])]
+    top_products = [(names[i], int(scores[i])) for i in top]
     return top_products
 
 # Streamlit UI
@@ -24,18 +24,30 @@ Features:
     --damping            : damping ratio (optional)
     --st                 : Strouhal number (default 0.22)
     --target-wfr         : target minimum WFR (default 2.2)
+    --batch FILE         : sweep every row of a CSV (header row of column names) or
+                           structured .npy file in one vectorized run (needs NumPy)
+    --batch-out FILE     : CSV written by --batch (default batch_results.csv in out-dir)
 
 Outputs:
 - Prints summary to console
 - Writes results JSON to results.json in out-dir (or current dir)
-- Writes SVG drawing to thermowell_drawing.svg in out-dir
+- Writes SVG drawing to thermowell_drawing.svg in out-dir (results.json holds
+  its path as svg_drawing_path rather than the markup)
 
 Example:
   python thermowell_simulator_cli.py --sample
   python thermowell_simulator_cli.py --velocity 5 --d_tip 0.012 --d_root 0.025 --immersion 0.2 --material-preset "Stainless Steel (SS316 / SS316L)"
+  python thermowell_simulator_cli.py --batch sweep.csv --batch-out sweep_results.csv
+    (sweep.csv columns, any subset: velocity, fluid_density, viscosity, immersion,
+     d_root, d_tip, d_bore, support_compliance, sensor_mass, damping; missing
+     columns take the matching CLI option or its default)
 
 Note:
 - This script intentionally has no external runtime dependencies beyond Python 3.
+  NumPy is optional and only needed for compute_from_inputs_batch (parameter sweeps);
+  Numba, if installed, compiles the scalar kernel for callers looping over
+  compute_from_inputs(..., jit=True). Both are imported only when those paths run,
+  so a one-shot run imports little more than the standard library.
 - The formulas are engineering approximations consistent with the schema you provided:
     f_s = St * V / D_tip
     f_n ≈ (1.875^2 / (2π)) * sqrt( E I / (m' L^4) ) with an empirical tip-mass correction
@@ -46,14 +58,28 @@ Author: Copied/derived from previous V6 simulator implementation.
 """
 
 from __future__ import print_function
-import argparse
-import json
+import copy
+import dataclasses
+import functools
 import math
 import os
 import sys
+import types
 
 PI = math.pi
 
+# Model constants
+_ZETA_MIN = 0.005           # floor of the compliance-based default damping ratio
+_ZETA_PER_COMPLIANCE = 0.01
+_TIP_MASS_FACTOR = 0.23     # empirical tip-mass correction on the effective mass
+
+# Drawing layout (SVG px)
+_LEN_SCALE = 2000           # px per m of immersion length ...
+_LEN_PX_MIN = 80            # ... clamped to this range
+_LEN_PX_MAX = 520
+_DIAM_PX = 80.0             # the largest diameter is drawn this thick
+_MAX_D_FLOOR = 1e-6         # m; keeps the diameter scale finite when all diameters are 0
+
 # -------------------------
 # Material preset library
 # -------------------------
@@ -101,24 +127,34 @@ MATERIAL_LIBRARY = {
 }
 
 
+# Frozen (E, density, notes) per preset, unpacked in one step by resolve_material
+_MATERIAL = types.MappingProxyType({
+    name: (props.get("elastic_modulus_pa"), props.get("density_kg_per_m3"), props.get("notes", ""))
+    for name, props in MATERIAL_LIBRARY.items()
+})
+
+
 # -------------------------
 # Calculation helpers
 # -------------------------
-def area_circular(diameter):
-    return PI * (diameter ** 2) / 4.0
-
-
-def second_moment_circle(diameter):
-    return PI * (diameter ** 4) / 64.0
+_PI_4 = PI / 4.0
+_PI_64 = PI / 64.0
+# first cantilever mode: 1.875^2 / (2π)
+_BASE_COEFF = (1.875 ** 2) / (2.0 * PI)
 
 
+@functools.lru_cache(maxsize=128)
 def resolve_material(preset_name, e_override, rho_override):
+    """
+    Material properties for a preset plus optional E / density overrides.
+    Memoized on the (hashable) arguments, so the result is a read-only mapping
+    shared between callers; copy it with dict() before changing it.
+    """
     preset_name = preset_name or "Custom (enter below)"
-    preset = MATERIAL_LIBRARY.get(preset_name)
-    if preset is None:
-        raise ValueError("Unknown material preset '{}'".format(preset_name))
-    e_preset = preset.get("elastic_modulus_pa")
-    rho_preset = preset.get("density_kg_per_m3")
+    try:
+        e_preset, rho_preset, notes = _MATERIAL[preset_name]
+    except KeyError:
+        raise ValueError("Unknown material preset '{}'".format(preset_name)) from None
     e_used = e_override if e_override is not None else e_preset
     rho_used = rho_override if rho_override is not None else rho_preset
     overridden = False
@@ -128,16 +164,103 @@ def resolve_material(preset_name, e_override, rho_override):
         overridden = (e_override is not None) or (rho_override is not None)
     if e_used is None or rho_used is None:
         raise ValueError("Material properties incomplete: provide E and density via preset or overrides.")
-    return {
+    return types.MappingProxyType({
         "preset": preset_name,
         "elastic_modulus_pa": float(e_used),
         "density_kg_per_m3": float(rho_used),
-        "notes": preset.get("notes", ""),
+        "notes": notes,
         "overridden": overridden
-    }
+    })
 
 
-def compute_from_inputs(inputs, constants):
+def _core_kernel(v, rho_f, mu, immersion, d_root, d_tip, d_bore, e_mod, rho_mat,
+                 support_compliance, sensor_mass, damping, st):
+    """
+    The arithmetic of compute_from_inputs on plain floats (damping NaN = use the
+    compliance-based default). Plain Python; _jit_kernel() compiles it.
+    Returns (f_n, f_s, wfr, n_sc, amplification, a_root, i_root, m_prime,
+    mu_tip_ratio, effective_mass_factor, zeta, re_tip).
+    """
+    # derived geometry/properties (solid circular section)
+    d2 = d_root * d_root
+    a_root = _PI_4 * d2
+    i_root = _PI_64 * d2 * d2
+    m_prime = rho_mat * a_root  # kg/m
+
+    # damping ratio default (NaN = not given). The guards below are written as
+    # conditional expressions over cheap operands so LLVM can lower them to
+    # selects rather than branches; the plain-Python fallback still never
+    # evaluates the division it guards against.
+    zeta = max(_ZETA_MIN, _ZETA_PER_COMPLIANCE * support_compliance) if math.isnan(damping) else damping
+
+    # vortex shedding frequency
+    if d_tip <= 0:
+        raise ValueError("tip diameter must be > 0")
+    f_s = st * v / d_tip
+
+    # natural frequency (cantilever approx) with tip-mass empirical correction
+    denom_mu = m_prime * immersion
+    mu_tip_ratio = sensor_mass / denom_mu if (immersion > 0 and denom_mu > 0) else 0.0
+    effective_mass_factor = 1.0 + _TIP_MASS_FACTOR * mu_tip_ratio
+
+    if m_prime <= 0 or immersion <= 0:
+        raise ValueError("material density/root diameter/immersion must be > 0")
+
+    l2 = immersion * immersion
+    f_n = _BASE_COEFF * math.sqrt((e_mod * i_root) / (m_prime * (l2 * l2) * effective_mass_factor))
+
+    # wake frequency ratio WFR = f_n / f_s
+    wfr = f_n / f_s if f_s != 0 else math.inf
+
+    # Scruton number
+    bore_ratio = d_bore / d_tip
+    denom = 1.0 - bore_ratio * bore_ratio
+    n_sc = 2.0 * zeta * (m_prime / denom) if denom > 0 else math.inf
+
+    # stress amplification factor (steady-state linear oscillator response)
+    r = f_s / f_n if f_n != 0 else 0.0
+    one_m_r2 = 1.0 - r * r
+    two_zeta_r = 2.0 * zeta * r
+    amplification = (1.0 / math.sqrt(one_m_r2 * one_m_r2 + two_zeta_r * two_zeta_r)
+                     if f_n != 0 else math.inf)
+
+    re_tip = (rho_f * v * d_tip / mu) if mu > 0 else math.nan
+    return (f_n, f_s, wfr, n_sc, amplification, a_root, i_root, m_prime,
+            mu_tip_ratio, effective_mass_factor, zeta, re_tip)
+
+
+@functools.lru_cache(maxsize=None)
+def _jit_kernel():
+    """
+    _core_kernel compiled with Numba, for callers running many points through
+    compute_from_inputs(jit=True). Built on the first call so a normal one-shot
+    run never imports Numba; the plain function when Numba is not installed.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return _core_kernel
+    # Floating-point contraction / approximate-function flags only: the kernel
+    # relies on inf results, so the no-NaN / no-inf fastmath assumptions stay off.
+    return njit(cache=True, fastmath={"contract", "afn", "arcp"}, error_model="numpy")(_core_kernel)
+
+
+def _require_numpy(what):
+    """numpy, imported on demand: only the batch path needs it."""
+    try:
+        import numpy
+    except ImportError:
+        raise RuntimeError("{} requires NumPy".format(what)) from None
+    return numpy
+
+
+_REQUIRED_NUMERIC_INPUTS = (
+    "velocity_m_per_s", "fluid_density_kg_per_m3", "viscosity_pa_s", "immersion_length_m",
+    "root_diameter_m", "tip_diameter_m", "bore_diameter_m", "fillet_radius_m",
+)
+
+
+def compute_from_inputs(inputs, constants, want_svg=True, jit=False):
     """
     inputs: dict with keys:
       velocity_m_per_s, fluid_density_kg_per_m3, viscosity_pa_s,
@@ -145,22 +268,31 @@ def compute_from_inputs(inputs, constants):
       material_preset, elastic_modulus_pa (opt), material_density_kg_per_m3 (opt),
       support_compliance_factor, added_sensor_mass_kg, damping_ratio (opt)
     constants: dict with keys strouhal_number and target_wfr
+    want_svg: build the drawing; pass False when only the numbers are needed
+      (result["svg_drawing"] is then None)
+    jit: run the arithmetic through the Numba-compiled kernel (compiled on the
+      first such call); worth it only for sweeps / optimizer loops
     Returns: result dict
     """
-    # unpack
-    v = float(inputs["velocity_m_per_s"])
-    rho_f = float(inputs["fluid_density_kg_per_m3"])
-    mu = float(inputs["viscosity_pa_s"])
-    immersion = float(inputs["immersion_length_m"])
-    d_root = float(inputs["root_diameter_m"])
-    d_tip = float(inputs["tip_diameter_m"])
-    d_bore = float(inputs["bore_diameter_m"])
-    fillet = float(inputs["fillet_radius_m"])
+    # unpack: all numeric inputs converted in one pass; the slow path below
+    # only runs to name the offending field
+    raw = [inputs[key] for key in _REQUIRED_NUMERIC_INPUTS]
+    raw.append(inputs.get("support_compliance_factor", 1.0))
+    raw.append(inputs.get("added_sensor_mass_kg", 0.0))
+    try:
+        (v, rho_f, mu, immersion, d_root, d_tip, d_bore, fillet,
+         support_compliance, sensor_mass) = map(float, raw)
+    except (TypeError, ValueError):
+        keys = _REQUIRED_NUMERIC_INPUTS + ("support_compliance_factor", "added_sensor_mass_kg")
+        for key, value in zip(keys, raw):
+            try:
+                float(value)
+            except (TypeError, ValueError):
+                raise ValueError("input '{}' must be a number, got {!r}".format(key, value)) from None
+        raise
     preset = inputs.get("material_preset")
     e_override = inputs.get("elastic_modulus_pa")
     rho_override = inputs.get("material_density_kg_per_m3")
-    support_compliance = float(inputs.get("support_compliance_factor", 1.0))
-    sensor_mass = float(inputs.get("added_sensor_mass_kg", 0.0))
     damping = inputs.get("damping_ratio")
     damping = None if damping is None else float(damping)
 
@@ -172,54 +304,12 @@ def compute_from_inputs(inputs, constants):
     e_mod = mat["elastic_modulus_pa"]
     rho_mat = mat["density_kg_per_m3"]
 
-    # derived geometry/properties
-    a_root = area_circular(d_root)
-    i_root = second_moment_circle(d_root)
-    m_prime = rho_mat * a_root  # kg/m
-
-    # damping ratio default
-    if damping is not None:
-        zeta = damping
-    else:
-        zeta = max(0.005, 0.01 * support_compliance)
-
-    # vortex shedding frequency
-    if d_tip <= 0:
-        raise ValueError("tip diameter must be > 0")
-    f_s = const_st * v / d_tip
-
-    # natural frequency (cantilever approx) with tip-mass empirical correction
-    base_coeff = (1.875 ** 2) / (2.0 * PI)
-    mu_tip_ratio = 0.0
-    if immersion > 0:
-        denom_mu = m_prime * immersion
-        if denom_mu > 0:
-            mu_tip_ratio = sensor_mass / denom_mu
-    effective_mass_factor = 1.0 + 0.23 * mu_tip_ratio
-
-    if m_prime <= 0 or immersion <= 0:
-        raise ValueError("material density/root diameter/immersion must be > 0")
-
-    f_n = base_coeff * math.sqrt((e_mod * i_root) / (m_prime * (immersion ** 4) * effective_mass_factor))
-
-    # wake frequency ratio WFR = f_n / f_s
-    wfr = float("inf") if f_s == 0 else f_n / f_s
+    (f_n, f_s, wfr, n_sc, amplification, a_root, i_root, m_prime,
+     mu_tip_ratio, effective_mass_factor, zeta, re_tip) = (_jit_kernel() if jit else _core_kernel)(
+        v, rho_f, mu, immersion, d_root, d_tip, d_bore, e_mod, rho_mat,
+        support_compliance, sensor_mass, math.nan if damping is None else damping, const_st)
     resonance_risk = (wfr < target_wfr)
 
-    # Scruton number
-    denom = 1.0 - (d_bore / d_tip) ** 2 if d_tip != 0 else 0.0
-    if denom <= 0:
-        n_sc = float("inf")
-    else:
-        n_sc = 2.0 * zeta * (m_prime / denom)
-
-    # stress amplification factor (steady-state linear oscillator response)
-    if f_n == 0:
-        amplification = float("inf")
-    else:
-        r = f_s / f_n
-        amplification = 1.0 / math.sqrt((1.0 - r ** 2) ** 2 + (2.0 * zeta * r) ** 2)
-
     intermediates = {
         "a_root_m2": a_root,
         "i_root_m4": i_root,
@@ -228,12 +318,12 @@ def compute_from_inputs(inputs, constants):
         "effective_mass_factor": effective_mass_factor,
         "damping_ratio_used": zeta,
         "st": const_st,
-        "re_tip_based": (rho_f * v * d_tip / mu) if mu > 0 else None,
+        "re_tip_based": re_tip if mu > 0 else None,
         "vortex_shedding_freq_calc": "f_s = St * V / D_tip",
         "natural_freq_formula": "approx cantilever with empirical tip mass correction"
     }
 
-    svg = generate_svg(immersion, d_root, d_tip, d_bore, fillet)
+    svg = generate_svg(immersion, d_root, d_tip, d_bore, fillet) if want_svg else None
 
     result = {
         "natural_frequency_hz": float(f_n),
@@ -242,68 +332,230 @@ def compute_from_inputs(inputs, constants):
         "resonance_risk": bool(resonance_risk),
         "scruton_number": float(n_sc if n_sc != float("inf") else float("inf")),
         "stress_amplification_factor": float(amplification if amplification != float("inf") else float("inf")),
-        "material_used": mat,
+        "material_used": dict(mat),
         "svg_drawing": svg,
         "intermediates": intermediates
     }
     return result
 
 
+@dataclasses.dataclass
+class BatchInputs:
+    """
+    Struct-of-arrays inputs for compute_from_inputs_batch: one 1-D array per
+    quantity (scalars are fine and broadcast), all broadcast to a common shape
+    on construction. damping uses NaN for points taking the compliance-based
+    default. The material stays scalar for the whole batch.
+    """
+    velocity: object
+    fluid_density: object
+    viscosity: object
+    immersion: object
+    d_root: object
+    d_tip: object
+    d_bore: object
+    support_compliance: object = 1.0
+    sensor_mass: object = 0.0
+    damping: object = math.nan
+    material_preset: object = None
+    elastic_modulus: object = None
+    material_density: object = None
+
+    _ARRAY_FIELDS = ("velocity", "fluid_density", "viscosity", "immersion", "d_root", "d_tip",
+                     "d_bore", "support_compliance", "sensor_mass", "damping")
+
+    def __post_init__(self):
+        np = _require_numpy("BatchInputs")
+        arrays = np.broadcast_arrays(*[np.asarray(getattr(self, name), dtype=float)
+                                       for name in self._ARRAY_FIELDS])
+        for name, value in zip(self._ARRAY_FIELDS, arrays):
+            setattr(self, name, np.ascontiguousarray(value))
+
+    @classmethod
+    def from_inputs(cls, inputs):
+        """Build from a compute_from_inputs-style dict whose numeric values may be arrays."""
+        damping = inputs.get("damping_ratio")
+        return cls(
+            velocity=inputs["velocity_m_per_s"],
+            fluid_density=inputs["fluid_density_kg_per_m3"],
+            viscosity=inputs["viscosity_pa_s"],
+            immersion=inputs["immersion_length_m"],
+            d_root=inputs["root_diameter_m"],
+            d_tip=inputs["tip_diameter_m"],
+            d_bore=inputs["bore_diameter_m"],
+            support_compliance=inputs.get("support_compliance_factor", 1.0),
+            sensor_mass=inputs.get("added_sensor_mass_kg", 0.0),
+            damping=math.nan if damping is None else damping,
+            material_preset=inputs.get("material_preset"),
+            elastic_modulus=inputs.get("elastic_modulus_pa"),
+            material_density=inputs.get("material_density_kg_per_m3"),
+        )
+
+
+@dataclasses.dataclass
+class BatchResults:
+    """Struct-of-arrays outputs of compute_from_inputs_batch, one array per quantity."""
+    f_n: object
+    f_s: object
+    wfr: object
+    resonance_risk: object
+    n_sc: object
+    amplification: object
+    a_root: object
+    i_root: object
+    m_prime: object
+    mu_tip_ratio: object
+    effective_mass_factor: object
+    zeta: object
+    re_tip: object
+    material_used: dict
+
+
+def compute_from_inputs_batch(inputs, constants):
+    """
+    Vectorized compute_from_inputs for parameter sweeps / Monte Carlo runs.
+    inputs: a BatchInputs, or a compute_from_inputs-style dict whose numeric
+      values may be 1-D arrays (converted with BatchInputs.from_inputs)
+    constants: dict with keys strouhal_number and target_wfr
+    Returns: BatchResults (no SVG). Points the scalar version rejects
+    (tip diameter, density/root diameter or immersion <= 0) come back as NaN
+    instead of raising, so one bad point doesn't abort the sweep; that includes
+    resonance_risk, which is a float array (1.0 / 0.0, NaN when rejected).
+    """
+    np = _require_numpy("compute_from_inputs_batch")
+    if not isinstance(inputs, BatchInputs):
+        inputs = BatchInputs.from_inputs(inputs)
+
+    v = inputs.velocity
+    rho_f = inputs.fluid_density
+    mu = inputs.viscosity
+    immersion = inputs.immersion
+    d_root = inputs.d_root
+    d_tip = inputs.d_tip
+    d_bore = inputs.d_bore
+    support_compliance = inputs.support_compliance
+    sensor_mass = inputs.sensor_mass
+    damping = inputs.damping
+
+    const_st = float(constants.get("strouhal_number", 0.22))
+    target_wfr = float(constants.get("target_wfr", 2.2))
+
+    mat = resolve_material(inputs.material_preset, inputs.elastic_modulus, inputs.material_density)
+    e_mod = mat["elastic_modulus_pa"]
+    rho_mat = mat["density_kg_per_m3"]
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        d2 = d_root * d_root
+        a_root = _PI_4 * d2
+        i_root = _PI_64 * d2 * d2
+        m_prime = rho_mat * a_root
+
+        zeta = np.where(np.isnan(damping), np.maximum(_ZETA_MIN, _ZETA_PER_COMPLIANCE * support_compliance), damping)
+
+        valid = (d_tip > 0) & (m_prime > 0) & (immersion > 0)
+        f_s = np.where(valid, const_st * v / d_tip, np.nan)
+
+        mu_tip_ratio = np.where(valid, sensor_mass / (m_prime * immersion), 0.0)
+        effective_mass_factor = 1.0 + _TIP_MASS_FACTOR * mu_tip_ratio
+        l2 = immersion * immersion
+        f_n = np.where(valid, _BASE_COEFF * np.sqrt((e_mod * i_root) / (m_prime * (l2 * l2) * effective_mass_factor)),
+                       np.nan)
+
+        wfr = np.where(f_s != 0.0, f_n / f_s, np.inf)
+        # float 1.0 / 0.0, NaN where the point was rejected (a NaN wfr must not read as "no risk")
+        resonance_risk = np.where(valid, wfr < target_wfr, np.nan)
+
+        bore_ratio = d_bore / d_tip
+        denom = 1.0 - bore_ratio * bore_ratio
+        n_sc = np.where(denom > 0.0, 2.0 * zeta * m_prime / denom, np.inf)
+        n_sc = np.where(valid, n_sc, np.nan)
+
+        r = f_s / f_n
+        one_m_r2 = 1.0 - r * r
+        two_zeta_r = 2.0 * zeta * r
+        amplification = np.where(f_n != 0.0, 1.0 / np.sqrt(one_m_r2 * one_m_r2 + two_zeta_r * two_zeta_r), np.inf)
+
+        re_tip = np.where(mu > 0, rho_f * v * d_tip / mu, np.nan)
+
+    return BatchResults(
+        f_n=f_n, f_s=f_s, wfr=wfr, resonance_risk=resonance_risk, n_sc=n_sc,
+        amplification=amplification, a_root=a_root, i_root=i_root, m_prime=m_prime,
+        mu_tip_ratio=mu_tip_ratio, effective_mass_factor=effective_mass_factor,
+        zeta=zeta, re_tip=re_tip, material_used=dict(mat))
+
+
 # -------------------------
 # Visualization (SVG) helper
 # -------------------------
 def generate_svg(immersion, d_root, d_tip, d_bore, fillet):
     width = 720
     height = 240
-    l_px = max(80, min(520, int(immersion * 2000)))
+    l_px = max(_LEN_PX_MIN, min(_LEN_PX_MAX, int(immersion * _LEN_SCALE)))
     x0 = 80
     y_center = height // 2
 
-    max_diameter = max(d_root, d_tip, d_bore, 1e-6)
-    scale_d = 80.0 / max_diameter
+    max_diameter = max(d_root, d_tip, d_bore, _MAX_D_FLOOR)
+    scale_d = _DIAM_PX / max_diameter
     root_px = max(4, d_root * scale_d)
     tip_px = max(3, d_tip * scale_d)
     bore_px = max(3, d_bore * scale_d)
 
     stem_x_end = x0 + l_px
 
-    stem_svg = '<line x1="{x1}" y1="{y}" x2="{x2}" y2="{y}" stroke="#333" stroke-width="{sw}" stroke-linecap="round" />'.format(
-        x1=x0, x2=stem_x_end, y=y_center, sw=root_px)
-    tip_circle = '<circle cx="{cx}" cy="{cy}" r="{r}" fill="#777" stroke="#333" />'.format(
-        cx=stem_x_end + tip_px / 2 + 6, cy=y_center, r=tip_px / 2)
-    root_circle = '<circle cx="{cx}" cy="{cy}" r="{r}" fill="#999" stroke="#333" />'.format(
-        cx=x0 - root_px / 2 - 6, cy=y_center, r=root_px / 2)
-    bore_circle = '<circle cx="{cx}" cy="{cy}" r="{r}" fill="none" stroke="#0066cc" stroke-dasharray="4,2" />'.format(
-        cx=stem_x_end - (l_px * 0.15), cy=y_center, r=bore_px / 2)
-
-    immersion_label = '<line x1="{ax1}" y1="{ay}" x2="{ax2}" y2="{ay}" stroke="#444" marker-start="url(#arrow)" marker-end="url(#arrow)"/><text x="{tx}" y="{ty}" text-anchor="middle" font-size="12px" fill="#222">Immersion length = {imm:.3f} m</text>'.format(
-        ax1=x0, ax2=stem_x_end, ay=y_center - 40, tx=(x0 + stem_x_end) / 2, ty=y_center - 46, imm=immersion)
-
-    root_label = '<text x="{x}" y="{y}" font-size="11px" fill="#111" text-anchor="end">Root Ø {d:.3f} m</text>'.format(
-        x=x0 - root_px / 2 - 20, y=y_center + root_px / 2 + 20, d=d_root)
-    tip_label = '<text x="{x}" y="{y}" font-size="11px" fill="#111">Tip Ø {d:.3f} m</text>'.format(
-        x=stem_x_end + tip_px / 2 + 40, y=y_center + 5, d=d_tip)
-    bore_label = '<text x="{x}" y="{y}" font-size="11px" fill="#0066cc">Bore Ø {d:.3f} m</text>'.format(
-        x=stem_x_end - (l_px * 0.15) + bore_px / 2 + 30, y=y_center + 5, d=d_bore)
-    fillet_label = '<text x="{x}" y="{y}" font-size="11px" fill="#111">Fillet r {r:.3f} m</text>'.format(
-        x=x0 + 6, y=y_center - root_px / 2 - 8, r=fillet)
-
-    svg = (
-        '<svg width="{w}" height="{h}" xmlns="http://www.w3.org/2000/svg">'
+    tip_cx = stem_x_end + tip_px / 2 + 6
+    tip_r = tip_px / 2
+    root_cx = x0 - root_px / 2 - 6
+    root_r = root_px / 2
+    bore_cx = stem_x_end - (l_px * 0.15)
+    bore_r = bore_px / 2
+
+    imm_y = y_center - 40
+    imm_tx = (x0 + stem_x_end) / 2
+    imm_ty = y_center - 46
+    root_lx = x0 - root_px / 2 - 20
+    root_ly = y_center + root_px / 2 + 20
+    label_y = y_center + 5
+    tip_lx = stem_x_end + tip_px / 2 + 40
+    bore_lx = bore_cx + bore_px / 2 + 30
+    fillet_lx = x0 + 6
+    fillet_ly = y_center - root_px / 2 - 8
+
+    mount_x = x0 - 30
+    mount_y = y_center - 50
+    mount_tx = x0 - 15
+    mount_ty = y_center - 60
+
+    # label values, each converted once
+    imm_s = f"{immersion:.3f}"
+    d_root_s = f"{d_root:.3f}"
+    d_tip_s = f"{d_tip:.3f}"
+    d_bore_s = f"{d_bore:.3f}"
+    fillet_s = f"{fillet:.3f}"
+
+    # the whole drawing as one f-string (compiled to FORMAT_VALUE ops, no
+    # format-string parsing at run time)
+    return (
+        f'<svg width="{width}" height="{height}" xmlns="http://www.w3.org/2000/svg">'
         '<defs><marker id="arrow" markerWidth="10" markerHeight="10" refX="6" refY="5" orient="auto">'
         '<path d="M0,0 L10,5 L0,10 z" fill="#444"/></marker></defs>'
-        '<rect x="0" y="0" width="{w}" height="{h}" fill="#fafafa"/>'
-        '{stem}{tip}{root}{bore}{imm}{rootlab}{tiplab}{borelab}{fillab}'
-        '<rect x="{rx}" y="{ry}" width="30" height="100" fill="#ddd" stroke="#bbb" />'
-        '<text x="{tx}" y="{ty}" font-size="11px" text-anchor="middle" fill="#333">Mount</text>'
+        f'<rect x="0" y="0" width="{width}" height="{height}" fill="#fafafa"/>'
+        # stem, tip, root and bore
+        f'<line x1="{x0}" y1="{y_center}" x2="{stem_x_end}" y2="{y_center}" stroke="#333" stroke-width="{root_px}" stroke-linecap="round" />'
+        f'<circle cx="{tip_cx}" cy="{y_center}" r="{tip_r}" fill="#777" stroke="#333" />'
+        f'<circle cx="{root_cx}" cy="{y_center}" r="{root_r}" fill="#999" stroke="#333" />'
+        f'<circle cx="{bore_cx}" cy="{y_center}" r="{bore_r}" fill="none" stroke="#0066cc" stroke-dasharray="4,2" />'
+        # labels
+        f'<line x1="{x0}" y1="{imm_y}" x2="{stem_x_end}" y2="{imm_y}" stroke="#444" marker-start="url(#arrow)" marker-end="url(#arrow)"/>'
+        f'<text x="{imm_tx}" y="{imm_ty}" text-anchor="middle" font-size="12px" fill="#222">Immersion length = {imm_s} m</text>'
+        f'<text x="{root_lx}" y="{root_ly}" font-size="11px" fill="#111" text-anchor="end">Root Ø {d_root_s} m</text>'
+        f'<text x="{tip_lx}" y="{label_y}" font-size="11px" fill="#111">Tip Ø {d_tip_s} m</text>'
+        f'<text x="{bore_lx}" y="{label_y}" font-size="11px" fill="#0066cc">Bore Ø {d_bore_s} m</text>'
+        f'<text x="{fillet_lx}" y="{fillet_ly}" font-size="11px" fill="#111">Fillet r {fillet_s} m</text>'
+        # mount
+        f'<rect x="{mount_x}" y="{mount_y}" width="30" height="100" fill="#ddd" stroke="#bbb" />'
+        f'<text x="{mount_tx}" y="{mount_ty}" font-size="11px" text-anchor="middle" fill="#333">Mount</text>'
         '</svg>'
-    ).format(
-        w=width, h=height,
-        stem=stem_svg, tip=tip_circle, root=root_circle, bore=bore_circle,
-        imm=immersion_label, rootlab=root_label, tiplab=tip_label, borelab=bore_label, fillab=fillet_label,
-        rx=x0 - 30, ry=y_center - 50, tx=x0 - 15, ty=y_center - 60
     )
-    return svg
 
 
 # -------------------------
@@ -341,7 +593,62 @@ def default_sample_schema():
     }
 
 
+def _has_nonfinite(obj):
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_nonfinite(v) for v in obj.values())
+    return False
+
+
+def _fast_dumps(obj):
+    """
+    Indented JSON as bytes: orjson when installed, else the json module. orjson
+    writes inf/NaN as null, so results holding them (e.g. an infinite Scruton
+    number) go through json to keep its Infinity/NaN output.
+    """
+    if not _has_nonfinite(obj):
+        try:
+            # Rust JSON encoder; optional
+            import orjson
+        except ImportError:
+            pass
+        else:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    import json  # CLI/I-O only; kept out of library imports
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _write_bytes(path, payload):
+    """Write payload to path straight through the fd (no buffered/text layer)."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_schema_cached(path, mtime_ns, size):
+    import json
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _load_schema(path):
+    """
+    Parse a JSON schema file, reusing the parsed copy while the file's
+    mtime/size are unchanged. Callers get their own deep copy to modify.
+    """
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    return copy.deepcopy(_load_schema_cached(path, st.st_mtime_ns, st.st_size))
+
+
 def parse_args(argv):
+    import argparse  # only the CLI needs it; library imports skip the cost
     parser = argparse.ArgumentParser(description="Thermowell Simulator (CLI, single-file).")
     parser.add_argument("--sample", action="store_true", help="Run built-in sample case and exit.")
     parser.add_argument("--schema", type=str, help="Path to JSON schema file (your schema format).")
@@ -367,9 +674,80 @@ def parse_args(argv):
     parser.add_argument("--st", type=float, default=0.22, help="Strouhal number")
     parser.add_argument("--target-wfr", type=float, default=2.2, help="Target minimum WFR")
 
+    parser.add_argument("--batch", type=str, help="CSV (with header) or structured .npy of operating points to sweep.")
+    parser.add_argument("--batch-out", type=str, dest="batch_out", default=None,
+                        help="Output CSV for --batch (default batch_results.csv in out-dir).")
+
     return parser.parse_args(argv)
 
 
+# --batch input columns: BatchInputs field -> (CLI option, default when neither given)
+_BATCH_COLUMNS = {
+    "velocity": ("velocity", 5.0),
+    "fluid_density": ("fluid_density", 1000.0),
+    "viscosity": ("viscosity", 0.001),
+    "immersion": ("immersion", 0.2),
+    "d_root": ("d_root", 0.025),
+    "d_tip": ("d_tip", 0.012),
+    "d_bore": ("d_bore", 0.006),
+    "support_compliance": ("support_compliance", 1.0),
+    "sensor_mass": ("sensor_mass", 0.005),
+    "damping": ("damping", math.nan),
+}
+_BATCH_OUTPUTS = ("f_n", "f_s", "wfr", "resonance_risk", "n_sc", "amplification")
+
+
+def run_batch(args):
+    """Run the --batch sweep: read all rows, one compute_from_inputs_batch call, write a CSV."""
+    try:
+        np = _require_numpy("--batch")
+    except RuntimeError as exc:
+        print(exc, file=sys.stderr)
+        sys.exit(2)
+    try:
+        if args.batch.lower().endswith(".npy"):
+            table = np.load(args.batch)
+        else:
+            table = np.genfromtxt(args.batch, delimiter=",", names=True, dtype=float)
+    except Exception as exc:
+        print("Failed to read batch file '{}': {}".format(args.batch, exc), file=sys.stderr)
+        sys.exit(2)
+    table = np.atleast_1d(table)
+    columns = table.dtype.names
+    if columns is None:
+        print("Batch file '{}' needs named columns (CSV header row or structured .npy)".format(args.batch),
+              file=sys.stderr)
+        sys.exit(2)
+    unknown = sorted(set(columns) - set(_BATCH_COLUMNS))
+    if unknown:
+        print("Unknown batch column(s): {}".format(", ".join(unknown)), file=sys.stderr)
+        sys.exit(2)
+
+    fields = {}
+    for name, (option, default) in _BATCH_COLUMNS.items():
+        if name in columns:
+            fields[name] = table[name]
+        else:
+            value = getattr(args, option)
+            fields[name] = default if value is None else value
+    preset = args.material_preset or "Stainless Steel (SS316 / SS316L)"
+    try:
+        inputs = BatchInputs(material_preset=preset, elastic_modulus=args.E, material_density=args.rho, **fields)
+        res = compute_from_inputs_batch(inputs, {"strouhal_number": args.st, "target_wfr": args.target_wfr})
+    except Exception as exc:
+        print("Simulation error:", exc, file=sys.stderr)
+        sys.exit(3)
+
+    out_path = args.batch_out or os.path.join(args.out_dir, "batch_results.csv")
+    rows = np.column_stack([np.broadcast_to(getattr(res, name), res.f_n.shape) for name in _BATCH_OUTPUTS])
+    try:
+        np.savetxt(out_path, rows, delimiter=",", fmt="%.10g", header=",".join(_BATCH_OUTPUTS), comments="")
+    except Exception as exc:
+        print("Failed to write outputs: {}".format(exc), file=sys.stderr)
+        sys.exit(4)
+    print("Swept {} operating point(s); wrote: {}".format(len(rows), out_path))
+
+
 def main(argv):
     args = parse_args(argv)
 
@@ -381,12 +759,15 @@ def main(argv):
             print("Unable to create output directory '{}': {}".format(out_dir, exc), file=sys.stderr)
             sys.exit(2)
 
+    if args.batch:
+        run_batch(args)
+        return
+
     if args.sample:
         schema = default_sample_schema()
     elif args.schema:
         try:
-            with open(args.schema, "r") as f:
-                schema = json.load(f)
+            schema = _load_schema(args.schema)
         except Exception as exc:
             print("Failed to read schema file '{}': {}".format(args.schema, exc), file=sys.stderr)
             sys.exit(2)
@@ -471,7 +852,7 @@ def main(argv):
 
     # Run compute
     try:
-        results = compute_from_inputs(inputs_flat, consts)
+        results = compute_from_inputs(inputs_flat, consts, want_svg=True)
     except Exception as exc:
         print("Simulation error:", exc, file=sys.stderr)
         sys.exit(3)
@@ -491,22 +872,25 @@ def main(argv):
     print("Stress amplification factor: {:.6f}".format(results["stress_amplification_factor"]))
     print("------------------------------------\n")
 
-    # Write outputs
+    # Write outputs. The drawing goes only to its own file; results.json
+    # references it by path instead of embedding the markup.
     json_out_path = os.path.join(out_dir, "results.json")
     svg_out_path = os.path.join(out_dir, "thermowell_drawing.svg")
+    svg = results.pop("svg_drawing")
     try:
-        with open(json_out_path, "w") as jf:
-            json.dump(results, jf, indent=2)
-        with open(svg_out_path, "w") as sf:
-            sf.write(results["svg_drawing"])
+        if svg is not None:
+            # the labels contain "Ø", so UTF-8 rather than ASCII
+            _write_bytes(svg_out_path, svg.encode("utf-8"))
+            results["svg_drawing_path"] = svg_out_path
+        _write_bytes(json_out_path, _fast_dumps(results))
     except Exception as exc:
         print("Failed to write outputs: {}".format(exc), file=sys.stderr)
         sys.exit(4)
 
     print("Wrote results JSON to: {}".format(json_out_path))
-    print("Wrote SVG drawing to: {}\n".format(svg_out_path))
-    print("To view the drawing, open the SVG file in a browser.")
-
+    if svg is not None:
+        print("Wrote SVG drawing to: {}\n".format(svg_out_path))
+        print("To view the drawing, open the SVG file in a browser.")
 
 if __name__ == "__main__":
     main(sys.argv[1:])
\ No newline at end of file
@@ -10,13 +10,17 @@
 #     * If only one side (a, b, or c) is provided -> assumes theta = 45° (isosceles right triangle) by default.
 #       You can change the default assumption in the GUI.
 # - Validates impossible inputs and shows errors.
+# - solve_batch() / compute_array() solve whole arrays of triangles (e.g. a theta sweep) at once;
+#   both need NumPy, and solve_batch is compiled / multi-threaded when Numba is installed.
+#   Both are imported on the first batch call only, so the scalar GUI path never loads them.
 
 # Run:
 #     python3 triangle_simulator.py
 
+import functools
 import math
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, font as tkfont
 
 # --- Configuration defaults ---
 CANVAS_WIDTH = 600
@@ -24,20 +28,35 @@ CANVAS_HEIGHT = 400
 MARGIN = 40
 DEFAULT_HYPOTENUSE_IF_THETA_ONLY = 200.0
 DEFAULT_THETA_IF_SINGLE_SIDE = 45.0  # degrees
+REDRAW_DEBOUNCE_MS = 20  # requests arriving within this window collapse into one compute & draw
 
 # --- Helper math functions ---
 
+_DEG2RAD = math.pi / 180.0
+_RAD2DEG = 180.0 / math.pi
+_HALF_PI = math.pi * 0.5
+
 def deg_to_rad(d):
-    return d * math.pi / 180.0
+    return d * _DEG2RAD
 
 def rad_to_deg(r):
-    return r * 180.0 / math.pi
+    return r * _RAD2DEG
 
 def is_filled(s):
     return s is not None and s != ""
 
 # --- Solver logic ---
 
+def _flush(v):
+    # Round-off residue (|v| < 1e-12) -> exact 0.0; a chained compare instead of abs(); None passes through
+    return 0.0 if v is not None and -1e-12 < v < 1e-12 else v
+
+def _parse_opt(val):
+    # Entry text -> float, blank / None -> None (unknown)
+    if val is None or val == "":
+        return None
+    return float(val)
+
 def compute_from_inputs(a_in, b_in, c_in, theta_in_deg, assume_theta_for_single_side=None, scale_for_theta_only=None):
     """
     Given inputs (strings or None), try to compute all values (a, b, c, theta_deg).
@@ -49,140 +68,350 @@ def compute_from_inputs(a_in, b_in, c_in, theta_in_deg, assume_theta_for_single_
       - c = hypotenuse
       - theta is angle at the right-angle vertex between side a and hypotenuse (so cos = a/c, sin = b/c)
     """
-    # Parse inputs (allow blank)
-    def parse(val):
-        if val is None or val == "":
-            return None
-        return float(val)
-
-    a = parse(a_in)
-    b = parse(b_in)
-    c = parse(c_in)
-    theta_deg = parse(theta_in_deg)
-    note = ""
-
-    provided = sum(1 for v in (a, b, c, theta_deg) if v is not None)
-
-    # Convert angle to rad if present
-    theta = None
-    if theta_deg is not None:
-        theta = deg_to_rad(theta_deg)
-
-    # Solve cases with 2+ provided (unique except some degenerate)
-    try:
-        if provided >= 2:
-            # Try combinations in a priority order
-            if a is not None and b is not None:
-                if a < 0 or b < 0:
-                    raise ValueError("Side lengths must be non-negative.")
-                c = math.hypot(a, b)
-                theta = math.atan2(b, a)
-            elif a is not None and c is not None:
-                if a < 0 or c <= 0:
-                    raise ValueError("Sides must be positive.")
-                if a > c:
-                    raise ValueError("Hypotenuse c must be >= leg a.")
-                b_sq = c * c - a * a
-                if b_sq < -1e-9:
-                    raise ValueError("Invalid sides: c^2 - a^2 < 0.")
-                b = math.sqrt(max(0.0, b_sq))
-                theta = math.acos(a / c)
-            elif b is not None and c is not None:
-                if b < 0 or c <= 0:
-                    raise ValueError("Sides must be positive.")
-                if b > c:
-                    raise ValueError("Hypotenuse c must be >= leg b.")
-                a_sq = c * c - b * b
-                if a_sq < -1e-9:
-                    raise ValueError("Invalid sides: c^2 - b^2 < 0.")
-                a = math.sqrt(max(0.0, a_sq))
-                theta = math.asin(b / c)
-            elif a is not None and theta is not None:
-                if a < 0:
-                    raise ValueError("Side a must be non-negative.")
-                if abs(math.cos(theta)) < 1e-12:
-                    raise ValueError("Cos(theta) is zero; cannot determine c from a.")
-                c = a / math.cos(theta)
-                if c <= 0:
-                    raise ValueError("Computed hypotenuse is not positive.")
-                b = a * math.tan(theta)
-            elif b is not None and theta is not None:
-                if b < 0:
-                    raise ValueError("Side b must be non-negative.")
-                if abs(math.sin(theta)) < 1e-12:
-                    raise ValueError("Sin(theta) is zero; cannot determine c from b.")
-                c = b / math.sin(theta)
-                if c <= 0:
-                    raise ValueError("Computed hypotenuse is not positive.")
-                a = b / math.tan(theta)
-            elif c is not None and theta is not None:
-                if c <= 0:
-                    raise ValueError("Hypotenuse must be positive.")
-                a = c * math.cos(theta)
-                b = c * math.sin(theta)
-            else:
-                raise ValueError("Unsupported combination.")
-        else:
-            # Only one input given -> use assumptions
-            if theta is not None:
-                # Only theta provided -> choose scale_for_theta_only for hypotenuse by default
-                if scale_for_theta_only is None:
-                    scale_for_theta_only = DEFAULT_HYPOTENUSE_IF_THETA_ONLY
-                if scale_for_theta_only <= 0:
-                    raise ValueError("Scale/hypotenuse must be positive.")
-                c = scale_for_theta_only
-                a = c * math.cos(theta)
-                b = c * math.sin(theta)
-                note = f"Only theta provided. Assumed hypotenuse c = {scale_for_theta_only} for scale."
-            elif a is not None:
-                # Only a provided -> assume theta default
-                if assume_theta_for_single_side is None:
-                    assume_theta_for_single_side = DEFAULT_THETA_IF_SINGLE_SIDE
-                theta = deg_to_rad(assume_theta_for_single_side)
-                c = a / math.cos(theta)
-                b = a * math.tan(theta)
-                theta_deg = assume_theta_for_single_side
-                note = f"Only side a provided. Assumed theta = {assume_theta_for_single_side}°."
-            elif b is not None:
-                if assume_theta_for_single_side is None:
-                    assume_theta_for_single_side = DEFAULT_THETA_IF_SINGLE_SIDE
-                theta = deg_to_rad(assume_theta_for_single_side)
-                c = b / math.sin(theta)
-                a = b / math.tan(theta)
-                theta_deg = assume_theta_for_single_side
-                note = f"Only side b provided. Assumed theta = {assume_theta_for_single_side}°."
-            elif c is not None:
-                if assume_theta_for_single_side is None:
-                    assume_theta_for_single_side = DEFAULT_THETA_IF_SINGLE_SIDE
-                theta = deg_to_rad(assume_theta_for_single_side)
-                a = c * math.cos(theta)
-                b = c * math.sin(theta)
-                theta_deg = assume_theta_for_single_side
-                note = f"Only hypotenuse c provided. Assumed theta = {assume_theta_for_single_side}°."
-            else:
-                raise ValueError("No input provided.")
-    except ValueError:
-        raise
-
-    # Final checks and conversion back
-    if theta is None:
-        raise ValueError("Unable to determine angle theta.")
-
-    if theta_deg is None:
-        theta_deg = rad_to_deg(theta)
+    return _solve(_parse_opt(a_in), _parse_opt(b_in), _parse_opt(c_in), _parse_opt(theta_in_deg),
+                  assume_theta_for_single_side, scale_for_theta_only)
+
+
+# Each case solver takes (a, b, c, theta_deg, assume_theta_for_single_side, scale_for_theta_only)
+# with None for unknowns and returns (a, b, c, theta_deg, note).
+
+def _solve_ab(a, b, c, theta_deg, assume, scale):
+    if a < 0 or b < 0:
+        raise ValueError("Side lengths must be non-negative.")
+    c = math.hypot(a, b)
+    # a, b >= 0 here, so plain atan suffices (no quadrant logic); a == 0 is the vertical leg (or the 0/0 point)
+    theta = math.atan(b / a) if a else (_HALF_PI if b else 0.0)
+    return a, b, c, theta_deg if theta_deg is not None else rad_to_deg(theta), ""
+
+def _solve_ac(a, b, c, theta_deg, assume, scale):
+    if a < 0 or c <= 0:
+        raise ValueError("Sides must be positive.")
+    if a > c:
+        raise ValueError("Hypotenuse c must be >= leg a.")
+    # (c - a)(c + a) instead of c^2 - a^2: no cancellation or overflow near a ~ c
+    b = math.sqrt(c - a) * math.sqrt(c + a)
+    theta = math.acos(a / c)
+    return a, b, c, theta_deg if theta_deg is not None else rad_to_deg(theta), ""
+
+def _solve_bc(a, b, c, theta_deg, assume, scale):
+    if b < 0 or c <= 0:
+        raise ValueError("Sides must be positive.")
+    if b > c:
+        raise ValueError("Hypotenuse c must be >= leg b.")
+    a = math.sqrt(c - b) * math.sqrt(c + b)
+    theta = math.asin(b / c)
+    return a, b, c, theta_deg if theta_deg is not None else rad_to_deg(theta), ""
+
+def _solve_at(a, b, c, theta_deg, assume, scale):
+    if a < 0:
+        raise ValueError("Side a must be non-negative.")
+    theta = deg_to_rad(theta_deg)
+    s, co = math.sin(theta), math.cos(theta)
+    if abs(co) < 1e-12:
+        raise ValueError("Cos(theta) is zero; cannot determine c from a.")
+    c = a / co
+    if c <= 0:
+        raise ValueError("Computed hypotenuse is not positive.")
+    b = a * s / co
+    return a, b, c, theta_deg, ""
+
+def _solve_bt(a, b, c, theta_deg, assume, scale):
+    if b < 0:
+        raise ValueError("Side b must be non-negative.")
+    theta = deg_to_rad(theta_deg)
+    s, co = math.sin(theta), math.cos(theta)
+    if abs(s) < 1e-12:
+        raise ValueError("Sin(theta) is zero; cannot determine c from b.")
+    c = b / s
+    if c <= 0:
+        raise ValueError("Computed hypotenuse is not positive.")
+    a = b * co / s
+    return a, b, c, theta_deg, ""
+
+def _solve_ct(a, b, c, theta_deg, assume, scale):
+    if c <= 0:
+        raise ValueError("Hypotenuse must be positive.")
+    theta = deg_to_rad(theta_deg)
+    a = c * math.cos(theta)
+    b = c * math.sin(theta)
+    return a, b, c, theta_deg, ""
+
+# Only one input given -> use assumptions
+
+def _solve_theta_only(a, b, c, theta_deg, assume, scale):
+    # Only theta provided -> choose scale for hypotenuse by default
+    if scale is None:
+        scale = DEFAULT_HYPOTENUSE_IF_THETA_ONLY
+    if scale <= 0:
+        raise ValueError("Scale/hypotenuse must be positive.")
+    theta = deg_to_rad(theta_deg)
+    c = scale
+    a = c * math.cos(theta)
+    b = c * math.sin(theta)
+    return a, b, c, theta_deg, f"Only theta provided. Assumed hypotenuse c = {scale} for scale."
+
+def _solve_a_only(a, b, c, theta_deg, assume, scale):
+    if assume is None:
+        assume = DEFAULT_THETA_IF_SINGLE_SIDE
+    theta = deg_to_rad(assume)
+    s, co = math.sin(theta), math.cos(theta)
+    c = a / co
+    b = a * s / co
+    return a, b, c, assume, f"Only side a provided. Assumed theta = {assume}°."
+
+def _solve_b_only(a, b, c, theta_deg, assume, scale):
+    if assume is None:
+        assume = DEFAULT_THETA_IF_SINGLE_SIDE
+    theta = deg_to_rad(assume)
+    s, co = math.sin(theta), math.cos(theta)
+    c = b / s
+    a = b * co / s
+    return a, b, c, assume, f"Only side b provided. Assumed theta = {assume}°."
+
+def _solve_c_only(a, b, c, theta_deg, assume, scale):
+    if assume is None:
+        assume = DEFAULT_THETA_IF_SINGLE_SIDE
+    theta = deg_to_rad(assume)
+    a = c * math.cos(theta)
+    b = c * math.sin(theta)
+    return a, b, c, assume, f"Only hypotenuse c provided. Assumed theta = {assume}°."
+
+def _solve_nothing(a, b, c, theta_deg, assume, scale):
+    raise ValueError("No input provided.")
+
+# Which inputs are known, as a bitmask
+_A, _B, _C, _T = 1, 2, 4, 8
+
+# With 2+ inputs the first pair (in this priority order) that is fully known decides the solve
+_PAIR_SOLVERS = (
+    (_A | _B, _solve_ab),
+    (_A | _C, _solve_ac),
+    (_B | _C, _solve_bc),
+    (_A | _T, _solve_at),
+    (_B | _T, _solve_bt),
+    (_C | _T, _solve_ct),
+)
+_SINGLE_SOLVERS = {0: _solve_nothing, _T: _solve_theta_only, _A: _solve_a_only, _B: _solve_b_only, _C: _solve_c_only}
+
+def _pick_solver(mask):
+    if mask in _SINGLE_SOLVERS:
+        return _SINGLE_SOLVERS[mask]
+    return next(fn for pair, fn in _PAIR_SOLVERS if mask & pair == pair)
+
+# Every combination of known inputs resolved up front: solving is one lookup + call
+_SOLVERS = {mask: _pick_solver(mask) for mask in range(16)}
+
+
+@functools.lru_cache(maxsize=128)
+def _solve(a, b, c, theta_deg, assume_theta_for_single_side, scale_for_theta_only):
+    # Pure solver on parsed floats (None = unknown); memoized so repeated clicks with unchanged fields are a lookup
+    mask = (a is not None) | (b is not None) << 1 | (c is not None) << 2 | (theta_deg is not None) << 3
+    a, b, c, theta_deg, note = _SOLVERS[mask](a, b, c, theta_deg, assume_theta_for_single_side, scale_for_theta_only)
 
     # enforce non-negative small values
-    a = 0.0 if a is not None and abs(a) < 1e-12 else a
-    b = 0.0 if b is not None and abs(b) < 1e-12 else b
-    c = 0.0 if c is not None and abs(c) < 1e-12 else c
+    a, b, c = _flush(a), _flush(b), _flush(c)
 
     # sanity
     if c is not None and (a is None or b is None):
         raise ValueError("Computation incomplete.")
+    # legs must agree with c; math.hypot scales internally, so a^2 + b^2 never overflows here
+    if math.isfinite(c) and abs(math.hypot(a, b) - abs(c)) > 1e-9 * max(abs(c), 1.0):
+        raise ValueError("Inconsistent result: hypot(a, b) != c.")
 
     return a, b, c, theta_deg, note
 
 
+# --- Batch solver (sweeps / animation) ---
+# NumPy and Numba are imported on the first batch call only, so the GUI starts without them.
+
+def _require_numpy(what):
+    try:
+        import numpy
+    except ImportError:
+        raise RuntimeError("{} requires NumPy".format(what)) from None
+    return numpy
+
+
+def _solve_point(a, b, c, theta_deg, assume, scale):
+    """
+    Numeric twin of _solve for one triangle: NaN marks an unknown input, and
+    every input the scalar solver would reject gives an all-NaN result.
+    Returns (a, b, c, theta_deg). Compiled by _batch_kernel().
+    """
+    nan = math.nan
+    has_a, has_b, has_c, has_t = a == a, b == b, c == c, theta_deg == theta_deg
+    if has_a and has_b:
+        if a < 0 or b < 0:
+            return nan, nan, nan, nan
+        c = math.hypot(a, b)
+        if not has_t:
+            theta_deg = (math.atan(b / a) if a else (_HALF_PI if b else 0.0)) * _RAD2DEG
+    elif has_a and has_c:
+        if a < 0 or c <= 0 or a > c:
+            return nan, nan, nan, nan
+        b = math.sqrt(c - a) * math.sqrt(c + a)
+        if not has_t:
+            theta_deg = math.acos(a / c) * _RAD2DEG
+    elif has_b and has_c:
+        if b < 0 or c <= 0 or b > c:
+            return nan, nan, nan, nan
+        a = math.sqrt(c - b) * math.sqrt(c + b)
+        if not has_t:
+            theta_deg = math.asin(b / c) * _RAD2DEG
+    elif has_t:
+        theta = theta_deg * _DEG2RAD
+        s, co = math.sin(theta), math.cos(theta)
+        if has_a:
+            if a < 0 or abs(co) < 1e-12 or a / co <= 0:
+                return nan, nan, nan, nan
+            c = a / co
+            b = a * s / co
+        elif has_b:
+            if b < 0 or abs(s) < 1e-12 or b / s <= 0:
+                return nan, nan, nan, nan
+            c = b / s
+            a = b * co / s
+        else:
+            # c known, or theta alone (scale sets the hypotenuse)
+            if not has_c:
+                c = scale
+            if c <= 0:
+                return nan, nan, nan, nan
+            a = c * co
+            b = c * s
+    elif has_a or has_b or has_c:
+        theta_deg = assume
+        theta = assume * _DEG2RAD
+        s, co = math.sin(theta), math.cos(theta)
+        if has_a:
+            if co == 0.0:
+                return nan, nan, nan, nan
+            c = a / co
+            b = a * s / co
+        elif has_b:
+            if s == 0.0:
+                return nan, nan, nan, nan
+            c = b / s
+            a = b * co / s
+        else:
+            a = c * co
+            b = c * s
+    else:
+        return nan, nan, nan, nan
+
+    a = 0.0 if abs(a) < 1e-12 else a
+    b = 0.0 if abs(b) < 1e-12 else b
+    c = 0.0 if abs(c) < 1e-12 else c
+    if math.isfinite(c) and abs(math.hypot(a, b) - abs(c)) > 1e-9 * max(abs(c), 1.0):
+        return nan, nan, nan, nan
+    return a, b, c, theta_deg
+
+
+@functools.lru_cache(maxsize=None)
+def _batch_kernel():
+    """
+    solve_batch's parallel per-point loop, JIT-compiled with Numba on the first
+    call and reused afterwards; None when Numba is not installed.
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+    solve_point = njit(cache=True)(_solve_point)
+
+    @njit(parallel=True)
+    def solve_many(a, b, c, theta_deg, assume, scale, out):
+        for i in prange(a.size):
+            ra, rb, rc, rt = solve_point(a[i], b[i], c[i], theta_deg[i], assume[i], scale[i])
+            out[i, 0] = ra
+            out[i, 1] = rb
+            out[i, 2] = rc
+            out[i, 3] = rt
+
+    return solve_many
+
+
+def solve_batch(a=None, b=None, c=None, theta_deg=None,
+                assume_theta_for_single_side=DEFAULT_THETA_IF_SINGLE_SIDE,
+                scale_for_theta_only=DEFAULT_HYPOTENUSE_IF_THETA_ONLY):
+    """
+    Solve many triangles in one call, e.g. a theta sweep for an animation:
+        solve_batch(c=100.0, theta_deg=np.linspace(0.0, 90.0, 1000))
+    Inputs are scalars or arrays broadcast against each other; None or NaN
+    means unknown. Returns an array of shape broadcast_shape + (4,) holding
+    a, b, c, theta_deg; points the scalar solver would reject are NaN.
+    Compiled and multi-threaded with Numba when available, otherwise the
+    NumPy compute_array path.
+    """
+    np = _require_numpy("solve_batch")
+    solve_many = _batch_kernel()
+    if solve_many is None:
+        return compute_array(a, b, c, theta_deg, assume_theta_for_single_side, scale_for_theta_only)
+    args = np.broadcast_arrays(*[np.asarray(np.nan if v is None else v, dtype=float)
+                                 for v in (a, b, c, theta_deg, assume_theta_for_single_side, scale_for_theta_only)])
+    shape = args[0].shape
+    flat = [np.ascontiguousarray(x).reshape(-1) for x in args]
+    out = np.empty((flat[0].size, 4))
+    solve_many(*flat, out)
+    return out.reshape(shape + (4,))
+
+
+def compute_array(a=None, b=None, c=None, theta_deg=None,
+                  assume_theta_for_single_side=DEFAULT_THETA_IF_SINGLE_SIDE,
+                  scale_for_theta_only=DEFAULT_HYPOTENUSE_IF_THETA_ONLY):
+    """
+    Pure-NumPy counterpart of solve_batch with the same inputs and output:
+    every case is evaluated with whole-array ufuncs (hypot, arctan2, sin,
+    cos, ...) and the per-point case is picked with masks, so there is no
+    Python-level loop. Suits previews of many triangles (slider drags etc.).
+    """
+    np = _require_numpy("compute_array")
+    a, b, c, t, assume, scale = np.broadcast_arrays(*[np.asarray(np.nan if v is None else v, dtype=float)
+                                                      for v in (a, b, c, theta_deg, assume_theta_for_single_side, scale_for_theta_only)])
+    has_a, has_b, has_c, has_t = ~np.isnan(a), ~np.isnan(b), ~np.isnan(c), ~np.isnan(t)
+
+    # Case per point, in _SOLVERS priority order
+    ab = has_a & has_b
+    ac = has_a & has_c & ~has_b
+    bc = has_b & has_c & ~has_a
+    only_a = has_a & ~has_b & ~has_c
+    only_b = has_b & ~has_a & ~has_c
+    no_side = ~(has_a | has_b | has_c)
+    from_a = only_a                     # a + theta, or a alone with the assumed angle
+    from_b = only_b
+    from_c = ~(ab | ac | bc | from_a | from_b) & (has_c | has_t)  # c + theta, c alone, or theta alone (c = scale)
+
+    with np.errstate(all="ignore"):
+        theta = np.where(has_t, t, assume) * _DEG2RAD
+        s, co = np.sin(theta), np.cos(theta)
+        cc = np.where(has_c, c, scale)
+        leg_ac = np.sqrt(c - a) * np.sqrt(c + a)
+        leg_bc = np.sqrt(c - b) * np.sqrt(c + b)
+
+        ra = np.select([ab | ac | from_a, bc, from_b, from_c], [a, leg_bc, b * co / s, cc * co], np.nan)
+        rb = np.select([ab | bc | from_b, ac, from_a, from_c], [b, leg_ac, a * s / co, cc * s], np.nan)
+        rc = np.select([ab, ac | bc, from_a, from_b, from_c], [np.hypot(a, b), c, a / co, b / s, cc], np.nan)
+        rt = np.select([has_t, ab, ac, bc, ~no_side], [t, np.arctan2(b, a) * _RAD2DEG, np.arccos(a / c) * _RAD2DEG,
+                                                       np.arcsin(b / c) * _RAD2DEG, assume], np.nan)
+
+        bad = ((ab & ((a < 0) | (b < 0)))
+               | (ac & ((a < 0) | (c <= 0) | (a > c)))
+               | (bc & ((b < 0) | (c <= 0) | (b > c)))
+               | (from_a & has_t & ((a < 0) | (np.abs(co) < 1e-12) | (rc <= 0)))
+               | (from_b & has_t & ((b < 0) | (np.abs(s) < 1e-12) | (rc <= 0)))
+               | (from_a & ~has_t & (co == 0.0))
+               | (from_b & ~has_t & (s == 0.0))
+               | (from_c & (has_t | ~has_c) & (cc <= 0))
+               | (no_side & ~has_t))
+
+        out = np.stack([ra, rb, rc, rt], axis=-1)
+        out[..., :3] = np.where(np.abs(out[..., :3]) < 1e-12, 0.0, out[..., :3])
+        ra, rb, rc = out[..., 0], out[..., 1], out[..., 2]
+        bad |= np.isfinite(rc) & (np.abs(np.hypot(ra, rb) - np.abs(rc)) > 1e-9 * np.maximum(np.abs(rc), 1.0))
+    out[bad] = np.nan
+    return out
+
+
 # --- GUI ---
 
 class RightTriangleSimulator(tk.Tk):
@@ -232,39 +461,106 @@ class RightTriangleSimulator(tk.Tk):
         # Buttons
         btn_frame = ttk.Frame(left)
         btn_frame.grid(row=6, column=0, columnspan=3, pady=(8, 0), sticky="we")
-        ttk.Button(btn_frame, text="Compute & Draw", command=self.compute_and_draw).grid(row=0, column=0, padx=4)
+        ttk.Button(btn_frame, text="Compute & Draw", command=self.schedule_compute).grid(row=0, column=0, padx=4)
         ttk.Button(btn_frame, text="Reset", command=self.reset).grid(row=0, column=1, padx=4)
         ttk.Button(btn_frame, text="Quit", command=self.quit).grid(row=0, column=2, padx=4)
 
         # Results
         results_frame = ttk.LabelFrame(left, text="Computed values", padding=6)
         results_frame.grid(row=7, column=0, columnspan=3, pady=(10, 0), sticky="we")
-        self.result_text = tk.Text(results_frame, width=34, height=8, wrap="word")
-        self.result_text.grid(row=0, column=0)
+        # Read-only output: a StringVar-bound label is a single set() per update, no Text delete/insert round-trips.
+        # Sized like the old 34x8 text box so the layout does not jump with the number of lines.
+        fixed = tkfont.nametofont("TkFixedFont")
+        self.result_var = tk.StringVar()
+        ttk.Label(results_frame, textvariable=self.result_var, font=fixed, width=34, anchor="nw", justify="left",
+                  wraplength=fixed.measure("0" * 34)).grid(row=0, column=0, sticky="nw")
+        results_frame.rowconfigure(0, minsize=8 * fixed.metrics("linespace"))
 
         # Canvas for drawing
         canvas_frame = ttk.Frame(right)
         canvas_frame.grid(row=0, column=0)
         self.canvas = tk.Canvas(canvas_frame, width=CANVAS_WIDTH, height=CANVAS_HEIGHT, bg="white")
         self.canvas.grid(row=0, column=0)
+        self._items = self._create_triangle_items()
+        self._placeholder_id = self.canvas.create_text(
+            CANVAS_WIDTH // 2, CANVAS_HEIGHT // 2, text="Right Triangle Visualization\n(Click 'Compute & Draw' to render)",
+            font=("Arial", 14), fill="gray", justify="center", state="hidden")
+
+        # last (a, b, c, theta_deg, note) put on screen; an identical recompute skips the redraw
+        self._last_result = None
+        # pending after() id of a scheduled compute_and_draw
+        self._pending = None
+        # set while compute_and_draw runs
+        self._busy = False
 
         # initial drawing
         self.draw_placeholder()
 
+    def _create_triangle_items(self):
+        # Every primitive of the drawing, created once (hidden) and tagged "triangle";
+        # draw_triangle only moves / relabels them, so a redraw allocates no canvas items
+        cv = self.canvas
+        opts = {"state": "hidden", "tags": ("triangle",)}
+        return {
+            "side_a": cv.create_line(0, 0, 0, 0, width=3, fill="blue", **opts),
+            "side_b": cv.create_line(0, 0, 0, 0, width=3, fill="green", **opts),
+            "side_c": cv.create_line(0, 0, 0, 0, width=3, fill="red", **opts),
+            "point_a": cv.create_oval(0, 0, 0, 0, fill="black", **opts),
+            "name_a": cv.create_text(0, 0, text="A (θ)", anchor="e", **opts),
+            "point_b": cv.create_oval(0, 0, 0, 0, fill="black", **opts),
+            "name_b": cv.create_text(0, 0, text="B", **opts),
+            "point_c": cv.create_oval(0, 0, 0, 0, fill="black", **opts),
+            "name_c": cv.create_text(0, 0, text="C", anchor="e", **opts),
+            "label_a": cv.create_text(0, 0, fill="blue", **opts),
+            "label_b": cv.create_text(0, 0, fill="green", **opts),
+            "label_c": cv.create_text(0, 0, fill="red", **opts),
+            "square_v": cv.create_line(0, 0, 0, 0, fill="black", width=2, **opts),
+            "square_h": cv.create_line(0, 0, 0, 0, fill="black", width=2, **opts),
+            "theta_arc": cv.create_arc(0, 0, 0, 0, start=0, extent=0, style="arc", width=2, **opts),
+            "theta_label": cv.create_text(0, 0, anchor="center", **opts),
+            "footer": cv.create_text(CANVAS_WIDTH / 2, 15, text="Right Triangle (A at right angle). a adj. to θ, b opp. to θ, c hypotenuse",
+                                     font=("Arial", 10), **opts),
+            "scale_label": cv.create_text(10 + 80, CANVAS_HEIGHT - 10, anchor="w", fill="gray", **opts),
+        }
+
     def draw_placeholder(self):
-        self.canvas.delete("all")
-        self.canvas.create_text(CANVAS_WIDTH // 2, CANVAS_HEIGHT // 2, text="Right Triangle Visualization\n(Click 'Compute & Draw' to render)",
-                                font=("Arial", 14), fill="gray", justify="center")
+        # Both the triangle and this text persist; switching between them is two state flips
+        self.canvas.itemconfigure("triangle", state="hidden")
+        self.canvas.itemconfigure(self._placeholder_id, state="normal")
+
+    def schedule_compute(self):
+        # Debounce: restart the timer on every request so a burst (double-click, key repeat) runs one compute
+        if self._pending is not None:
+            self.after_cancel(self._pending)
+        self._pending = self.after(REDRAW_DEBOUNCE_MS, self._run_scheduled_compute)
+
+    def _run_scheduled_compute(self):
+        self._pending = None
+        self.compute_and_draw()
 
     def reset(self):
+        if self._pending is not None:
+            self.after_cancel(self._pending)
+            self._pending = None
         self.a_var.set("")
         self.b_var.set("")
         self.c_var.set("")
         self.theta_var.set("")
-        self.result_text.delete("1.0", tk.END)
+        self.result_var.set("")
+        self._last_result = None
         self.draw_placeholder()
 
     def compute_and_draw(self):
+        # Skip re-entrant calls: the error dialog runs a nested event loop in which a scheduled compute could fire
+        if self._busy:
+            return
+        self._busy = True
+        try:
+            self._compute_and_draw()
+        finally:
+            self._busy = False
+
+    def _compute_and_draw(self):
         a_in = self.a_var.get().strip()
         b_in = self.b_var.get().strip()
         c_in = self.c_var.get().strip()
@@ -273,8 +569,8 @@ class RightTriangleSimulator(tk.Tk):
         try:
             a, b, c, theta_deg, note = compute_from_inputs(
                 a_in, b_in, c_in, theta_in,
-                assume_theta_for_single_side=float(self.assume_theta_var.get()),
-                scale_for_theta_only=float(self.assume_scale_var.get()),
+                assume_theta_for_single_side=self.assume_theta_var.get(),
+                scale_for_theta_only=self.assume_scale_var.get(),
             )
         except ValueError as e:
             messagebox.showerror("Invalid input", str(e))
@@ -283,21 +579,26 @@ class RightTriangleSimulator(tk.Tk):
             messagebox.showerror("Error", f"Unexpected error: {e}")
             return
 
+        if (a, b, c, theta_deg, note) == self._last_result:
+            return
+        self._last_result = (a, b, c, theta_deg, note)
+
         # Update result text
-        self.result_text.delete("1.0", tk.END)
         txt = f"a (adjacent)  = {a:.6g}\n"
         txt += f"b (opposite)  = {b:.6g}\n"
         txt += f"c (hypotenuse)= {c:.6g}\n"
         txt += f"theta         = {theta_deg:.6g}°\n"
         if note:
             txt += "\nNote: " + note + "\n"
-        self.result_text.insert("1.0", txt)
+        self.result_var.set(txt)
 
         # Draw triangle scaled to canvas
         self.draw_triangle(a, b, c, theta_deg)
 
     def draw_triangle(self, a, b, c, theta_deg):
-        self.canvas.delete("all")
+        cv = self.canvas
+        items = self._items
+        cv.itemconfigure(self._placeholder_id, state="hidden")
         # We interpret:
         # - angle theta at vertex A (origin)
         # - side a along +x from A
@@ -320,16 +621,7 @@ class RightTriangleSimulator(tk.Tk):
         avail_w = CANVAS_WIDTH - 2 * MARGIN
         avail_h = CANVAS_HEIGHT - 2 * MARGIN
 
-        # scale so both legs fit with margin, and also c fits diagonally
-        # but primarily ensure a fits horizontally and b fits vertically
-        scale_x = avail_w / (max_leg_x if max_leg_x > 0 else 1)  
-        scale_y = avail_h / (max_leg_y if max_leg_y > 0 else 1)  
-        scale = min(scale_x, scale_y, 1.0)  # do not enlarge by default beyond 1:1 unless it's tiny; but allow enlargement
-        # To allow enlargement for small triangles, if both legs are much smaller than avail, increase scale:
-        if scale > 1.0:
-            scale = min(scale * 0.9, max(scale, 1.0))
-
-        # However, better to compute scale to maximize use of area:
+        # scale so both legs fit the area with a 10% margin (enlarging small triangles too)
         if max_leg_x > 0 and max_leg_y > 0:
             scale = min(avail_w / max_leg_x, avail_h / max_leg_y) * 0.9
         else:
@@ -349,37 +641,39 @@ class RightTriangleSimulator(tk.Tk):
         Bx, By = x0 + a_s, y0
         Cx, Cy = x0, y0 - b_s
 
-        # Draw legs and hypotenuse
-        self.canvas.create_line(Ax, Ay, Bx, By, width=3, fill="blue")  # side a
-        self.canvas.create_line(Ax, Ay, Cx, Cy, width=3, fill="green")  # side b
-        self.canvas.create_line(Bx, By, Cx, Cy, width=3, fill="red")  # hypotenuse
+        # Move legs and hypotenuse
+        cv.coords(items["side_a"], Ax, Ay, Bx, By)
+        cv.coords(items["side_b"], Ax, Ay, Cx, Cy)
+        cv.coords(items["side_c"], Bx, By, Cx, Cy)
 
-        # Label points
+        # Move point markers and names
         point_radius = 4
-        self.canvas.create_oval(Ax - point_radius, Ay - point_radius, Ax + point_radius, Ay + point_radius, fill="black")
-        self.canvas.create_text(Ax - 10, Ay + 12, text="A (θ)", anchor="e")
-        self.canvas.create_oval(Bx - point_radius, By - point_radius, Bx + point_radius, By + point_radius, fill="black")
-        self.canvas.create_text(Bx + 8, By + 12, text="B")
-        self.canvas.create_oval(Cx - point_radius, Cy - point_radius, Cx + point_radius, Cy + point_radius, fill="black")
-        self.canvas.create_text(Cx - 8, Cy - 12, text="C", anchor="e")
+        cv.coords(items["point_a"], Ax - point_radius, Ay - point_radius, Ax + point_radius, Ay + point_radius)
+        cv.coords(items["name_a"], Ax - 10, Ay + 12)
+        cv.coords(items["point_b"], Bx - point_radius, By - point_radius, Bx + point_radius, By + point_radius)
+        cv.coords(items["name_b"], Bx + 8, By + 12)
+        cv.coords(items["point_c"], Cx - point_radius, Cy - point_radius, Cx + point_radius, Cy + point_radius)
+        cv.coords(items["name_c"], Cx - 8, Cy - 12)
 
         # Label sides with midpoints
-        mid_ab = ((Ax + Bx) / 2, (Ay + By) / 2)
-        mid_ac = ((Ax + Cx) / 2, (Ay + Cy) / 2)
-        mid_bc = ((Bx + Cx) / 2, (By + Cy) / 2)
-
-        self.canvas.create_text(mid_ab[0], mid_ab[1] + 12, text=f"a = {a:.4g}", fill="blue")
-        self.canvas.create_text(mid_ac[0] - 12, mid_ac[1], text=f"b = {b:.4g}", fill="green")
+        mab_x, mab_y = (Ax + Bx) * 0.5, (Ay + By) * 0.5
+        mac_x, mac_y = (Ax + Cx) * 0.5, (Ay + Cy) * 0.5
+        mbc_x, mbc_y = (Bx + Cx) * 0.5, (By + Cy) * 0.5
+
+        cv.coords(items["label_a"], mab_x, mab_y + 12)
+        cv.itemconfigure(items["label_a"], text=f"a = {a:.4g}")
+        cv.coords(items["label_b"], mac_x - 12, mac_y)
+        cv.itemconfigure(items["label_b"], text=f"b = {b:.4g}")
         # Place c label at a small offset perpendicular to hypotenuse
-        self.canvas.create_text(mid_bc[0] + 14, mid_bc[1] - 8, text=f"c = {c:.4g}", fill="red")
+        cv.coords(items["label_c"], mbc_x + 14, mbc_y - 8)
+        cv.itemconfigure(items["label_c"], text=f"c = {c:.4g}")
 
-        # Draw right angle square at A
+        # Right angle square at A
         sq_size = min(20, min(a_s, b_s) * 0.2)
-        self.canvas.create_line(Ax + sq_size, Ay, Ax + sq_size, Ay - sq_size, fill="black", width=2)
-        self.canvas.create_line(Ax + sq_size, Ay - sq_size, Ax, Ay - sq_size, fill="black", width=2)
+        cv.coords(items["square_v"], Ax + sq_size, Ay, Ax + sq_size, Ay - sq_size)
+        cv.coords(items["square_h"], Ax + sq_size, Ay - sq_size, Ax, Ay - sq_size)
 
-        # Draw theta arc near A
-        theta_rad = deg_to_rad(theta_deg)
+        # Theta arc near A
         # arc bounding box (small)
         arc_r = min(60, min(a_s, b_s) * 0.6 + 10)
         arc_bbox = (Ax - arc_r, Ay - arc_r, Ax + arc_r, Ay + arc_r)
@@ -389,26 +683,28 @@ class RightTriangleSimulator(tk.Tk):
         # But we want arc between +x (a) and +y-negative (b) direction; since b goes up, that's CCW positive, but on canvas y is inverted.
         # Use extent = -theta_deg to draw small arc visually consistent.
         try:
-            self.canvas.create_arc(arc_bbox, start=start_deg, extent=extent_deg, style="arc", width=2)
+            cv.coords(items["theta_arc"], *arc_bbox)
+            cv.itemconfigure(items["theta_arc"], start=start_deg, extent=extent_deg)
         except Exception:
             pass
-        # Label theta
-        theta_label_x = Ax + arc_r * 0.6 * math.cos(deg_to_rad(theta_deg / 2))
-        theta_label_y = Ay - arc_r * 0.6 * math.sin(deg_to_rad(theta_deg / 2))
-        self.canvas.create_text(theta_label_x, theta_label_y, text=f"θ = {theta_deg:.3g}°", anchor="center")
-
-        # Footer info
-        self.canvas.create_text(CANVAS_WIDTH / 2, 15, text="Right Triangle (A at right angle). a adj. to θ, b opp. to θ, c hypotenuse",
-                                font=("Arial", 10))
+        # Label theta at the arc's mid-angle: one conversion, one cos/sin pair
+        half_rad = (theta_deg * 0.5) * _DEG2RAD
+        label_r = arc_r * 0.6
+        theta_label_x = Ax + label_r * math.cos(half_rad)
+        theta_label_y = Ay - label_r * math.sin(half_rad)
+        cv.coords(items["theta_label"], theta_label_x, theta_label_y)
+        cv.itemconfigure(items["theta_label"], text=f"θ = {theta_deg:.3g}°")
 
         # Show scale factor info
-        self.canvas.create_text(10 + 80, CANVAS_HEIGHT - 10, text=f"scale = {scale:.4g} px/unit", anchor="w", fill="gray")
+        cv.itemconfigure(items["scale_label"], text=f"scale = {scale:.4g} px/unit")
 
         # Draw coordinates for debugging if needed (comment out)
         # self.canvas.create_text(80, CANVAS_HEIGHT - 30, text=f"A=({Ax:.1f},{Ay:.1f}) B=({Bx:.1f},{By:.1f}) C=({Cx:.1f},{Cy:.1f})", anchor="w", fill="gray")
 
+        cv.itemconfigure("triangle", state="normal")
+
         # nice bounding box
-        self.canvas.configure(scrollregion=(0, 0, CANVAS_WIDTH, CANVAS_HEIGHT))
+        cv.configure(scrollregion=(0, 0, CANVAS_WIDTH, CANVAS_HEIGHT))
 
 
 if __name__ == "__main__":